@@ -6,11 +6,13 @@ for better separation of concerns.
 """
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 import discord
 from discord.ext import commands
 
+from yuuka.config import CHART_PROCESS_WORKERS
 from yuuka.db import BudgetRepository, LedgerRepository, get_repository
 from yuuka.services import TransactionNLPService
 from yuuka.services.export import ExportService
@@ -58,6 +60,9 @@ class YuukaBot(commands.Bot):
 
             # Scheduler will be set up in setup_hook when bot is ready
             self.scheduler: Optional[RecapScheduler] = None
+
+            # Chart worker processes, started in setup_hook
+            self.chart_pool: Optional[ProcessPoolExecutor] = None
         except Exception as e:
             logger.error(f"Failed to initialize bot services: {e}", exc_info=True)
             raise
@@ -67,6 +72,10 @@ class YuukaBot(commands.Bot):
         try:
             logger.info("Starting bot setup...")
 
+            # Charts are drawn in worker processes so they render in parallel
+            # without holding the event loop
+            self.chart_pool = ProcessPoolExecutor(max_workers=CHART_PROCESS_WORKERS)
+
             # Add cogs with their dependencies
             await self.add_cog(GeneralCog(self))
             logger.info("Added GeneralCog")
@@ -104,6 +113,7 @@ class YuukaBot(commands.Bot):
                     self.repository,
                     self.budget_repo,
                     self.recap_service,
+                    self.chart_pool,
                 )
             )
             logger.info("Added RecapCog")
@@ -169,6 +179,9 @@ class YuukaBot(commands.Bot):
         if self.scheduler:
             self.scheduler.stop()
             logger.info("Stopped recap scheduler")
+        if self.chart_pool:
+            self.chart_pool.shutdown(wait=False, cancel_futures=True)
+            logger.info("Stopped chart worker processes")
         await super().close()
 
 
@@ -8,8 +8,15 @@ This cog supports the double-entry bookkeeping system with proper
 debit/credit accounting.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Optional
+import random
+import sqlite3
+import time
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Optional
 
 import discord
 from discord import app_commands
@@ -17,14 +24,139 @@ from discord.ext import commands
 
 from yuuka.db import LedgerEntry, LedgerRepository
 from yuuka.models import TransactionAction
-from yuuka.models.account import AccountType
+from yuuka.models.account import AccountType, EntryType
+
+from ..utils import safe_respond
 
 logger = logging.getLogger(__name__)
 
+# Retry policy for deletes that hit transient SQLite lock contention
+DELETE_MAX_ATTEMPTS = 3
+DELETE_RETRY_BASE_DELAY = 0.05  # seconds, doubled on each attempt
+TRANSIENT_DB_ERRORS = ("database is locked", "database table is locked", "busy")
+
+# Action filter values accepted by /history
+ACTION_LOOKUP = {a.value: a for a in TransactionAction}
+
+# Display emoji for ledger actions and account types
+ACTION_EMOJI = {
+    "incoming": "📥",
+    "outgoing": "📤",
+    "transfer": "🔄",
+}
+ACCOUNT_TYPE_EMOJI = {
+    AccountType.ASSET: "💰",
+    AccountType.LIABILITY: "📋",
+    AccountType.EQUITY: "🏦",
+    AccountType.REVENUE: "📈",
+    AccountType.EXPENSE: "📉",
+}
+
+# Characters dropped from typed amounts before parsing
+AMOUNT_SEPARATORS = str.maketrans("", "", ", _")
+
+# Characters in account names that would break out of a code block row
+CODE_BLOCK_UNSAFE = str.maketrans({"`": "'", "\n": " ", "\r": " "})
+
+# Pre-bound row templates for history entries and the report tables
+ENTRY_ROW = (
+    "`#{id}` {emoji} **{action}** {amount:,.0f} | "
+    "{source} → {destination} | {description} | {created_at}"
+).format
+BALANCE_ROW = "{name:<18} | Rp {amount:>14,.0f}".format
+TRIAL_BALANCE_ROW = "{name:<20} {debit:>12} {credit:>12}".format
+INCOME_STATEMENT_ROW = "  {name:<20} {amount:>12,.0f}".format
+BALANCE_SHEET_ROW = "  {name:<18} Rp {amount:>14,.0f}".format
+
+# Whole-message templates for /summary and /balance
+SUMMARY_MESSAGE = (
+    "📊 **Ledger Summary**\n"
+    "```\n"
+    "📥 Incoming:  {incoming[count]:>4} entries | {incoming[total]:>15,.0f}\n"
+    "📤 Outgoing:  {outgoing[count]:>4} entries | {outgoing[total]:>15,.0f}\n"
+    "🔄 Transfer:  {transfer[count]:>4} entries | {transfer[total]:>15,.0f}\n"
+    "{rule}\n"
+    "{net_emoji} Net:                        | {net:>15,.0f}\n"
+    "```"
+).format
+BALANCE_MESSAGE = (
+    "💰 **Your Pockets/Wallets**\n"
+    "```\n"
+    "{rows}\n"
+    "```\n"
+    "\n"
+    "💵 **Total Balance:** Rp {total:,.0f}"
+).format
+
+# Static report headers and rules, built once at import
+TRIAL_BALANCE_HEADER = TRIAL_BALANCE_ROW(name="Account", debit="Debit", credit="Credit")
+TRIAL_BALANCE_RULE = "─" * 46
+SUMMARY_RULE = "─" * 45
+
+# Report sections as (field name, report key, empty placeholder, total label)
+INCOME_STATEMENT_SECTIONS = (
+    ("📈 Revenue", "revenue", "(no revenue)", "Total Revenue"),
+    ("📉 Expenses", "expenses", "(no expenses)", "Total Expenses"),
+)
+BALANCE_SHEET_SECTIONS = (
+    ("💰 Assets", "assets", "(no assets)", "Total Assets"),
+    ("📋 Liabilities", "liabilities", "(no liabilities)", "Total Liabilities"),
+    ("🏛️ Equity (incl. Retained Earnings)", "equity", None, "Total Equity"),
+)
+
+# Discord embed limits; the total leaves headroom for the footer note
+EMBED_FIELD_VALUE_LIMIT = 1024
+EMBED_MAX_FIELDS = 25
+EMBED_TOTAL_LIMIT = 5900
+EMBED_TRUNCATED_NOTE = "Some rows were left out to fit Discord's embed limits."
+
+# Maximum number of asset accounts listed by /balance
+BALANCE_MAX_ACCOUNTS = 30
+
+# Seconds a financial snapshot is reused across back-to-back report commands
+SNAPSHOT_CACHE_TTL = 10.0
+
+
+def is_transient_db_error(error: Exception) -> bool:
+    """Check if a database error is transient (lock/busy) and worth retrying."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    message = str(error).lower()
+    return any(marker in message for marker in TRANSIENT_DB_ERRORS)
+
+
+def parse_amount_input(text: str) -> float:
+    """
+    Parse an amount typed into a form field.
+
+    Commas, underscores and spaces are dropped as thousands separators. Dots
+    are treated as Indonesian thousands separators ("1.500.000", "52.500")
+    and otherwise as the decimal point, so "1.50" stays 1.5.
+
+    Raises:
+        ValueError: If the text is not a finite number
+    """
+    number_str = text.strip().translate(AMOUNT_SEPARATORS)
+    _, dot, fraction = number_str.partition(".")
+    if dot and ("." in fraction or len(fraction) == 3):
+        number_str = number_str.replace(".", "")
+
+    try:
+        amount = Decimal(number_str)
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount: {text!r}") from None
+    if not amount.is_finite():
+        raise ValueError(f"Invalid amount: {text!r}")
+    return float(amount)
+
 
 class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
     """Modal for editing an existing transaction."""
 
+    # The TextInput fields below are class attributes discord.py copies per
+    # instance, so only the plain attributes set in __init__ are slotted
+    __slots__ = ("repository", "transaction_id", "user_id")
+
     amount = discord.ui.TextInput(
         label="Amount",
         placeholder="Enter new amount (leave empty to keep current)",
@@ -80,13 +212,10 @@ class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
         try:
             # Parse and validate amount
             new_amount = None
-            if self.amount.value and self.amount.value.strip():
+            amount_text = self.amount.value.strip()
+            if amount_text:
                 try:
-                    # Remove commas and parse
-                    amount_str = (
-                        self.amount.value.strip().replace(",", "").replace(".", "")
-                    )
-                    new_amount = float(amount_str)
+                    new_amount = parse_amount_input(amount_text)
                     if new_amount <= 0:
                         await interaction.response.send_message(
                             "❌ Amount must be a positive number.",
@@ -101,19 +230,9 @@ class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
                     return
 
             # Get new values (None means keep current)
-            new_source = (
-                self.source.value.strip() if self.source.value.strip() else None
-            )
-            new_destination = (
-                self.destination.value.strip()
-                if self.destination.value.strip()
-                else None
-            )
-            new_description = (
-                self.description.value.strip()
-                if self.description.value.strip()
-                else None
-            )
+            new_source = self.source.value.strip() or None
+            new_destination = self.destination.value.strip() or None
+            new_description = self.description.value.strip() or None
 
             # Check if anything changed
             if (
@@ -129,7 +248,8 @@ class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
                 return
 
             # Update the transaction
-            updated_txn = self.repository.update_transaction(
+            updated_txn = await asyncio.to_thread(
+                self.repository.update_transaction,
                 transaction_id=self.transaction_id,
                 user_id=self.user_id,
                 new_amount=new_amount,
@@ -139,6 +259,8 @@ class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
             )
 
             if updated_txn:
+                interaction.client.dispatch("ledger_updated", self.user_id)
+
                 # Format the updated transaction for display
                 lines = [
                     f"✅ Transaction `#{self.transaction_id}` updated successfully!",
@@ -149,7 +271,7 @@ class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
 
                 # Show the journal entries
                 for entry in updated_txn.entries:
-                    entry_type = "DR" if entry.entry_type.value == "debit" else "CR"
+                    entry_type = "DR" if entry.entry_type is EntryType.DEBIT else "CR"
                     lines.append(
                         f"{entry_type} {entry.account_name:<20} {entry.amount:>12,.0f}"
                     )
@@ -164,7 +286,7 @@ class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
                     ephemeral=True,
                 )
                 logger.info(
-                    f"User {self.user_id} updated transaction {self.transaction_id}"
+                    "User %s updated transaction %s", self.user_id, self.transaction_id
                 )
             else:
                 await interaction.response.send_message(
@@ -173,7 +295,9 @@ class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
                 )
 
         except Exception as e:
-            logger.error(f"Error in EditTransactionModal.on_submit: {e}", exc_info=True)
+            logger.error(
+                "Error in EditTransactionModal.on_submit: %s", e, exc_info=True
+            )
             await interaction.response.send_message(
                 "❌ An error occurred while updating the transaction. Please try again.",
                 ephemeral=True,
@@ -183,7 +307,7 @@ class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
         self, interaction: discord.Interaction, error: Exception
     ) -> None:
         """Handle modal errors."""
-        logger.error(f"Error in EditTransactionModal: {error}", exc_info=True)
+        logger.error("Error in EditTransactionModal: %s", error, exc_info=True)
         await interaction.response.send_message(
             "❌ An error occurred. Please try again.",
             ephemeral=True,
@@ -192,51 +316,196 @@ class EditTransactionModal(discord.ui.Modal, title="Edit Transaction"):
 
 def format_entry(entry: LedgerEntry) -> str:
     """Format a ledger entry for display in Discord."""
-    action_emoji = {
-        "incoming": "📥",
-        "outgoing": "📤",
-        "transfer": "🔄",
-    }
-
-    emoji = action_emoji.get(entry.action, "💰")
-    amount_str = f"{entry.amount:,.0f}"
-    date_str = entry.created_at.strftime("%Y-%m-%d %H:%M")
-
-    return (
-        f"`#{entry.id}` {emoji} **{entry.action}** {amount_str} | "
-        f"{entry.source or '-'} → {entry.destination or '-'} | "
-        f"{entry.description or '-'} | {date_str}"
+    return _format_entry_cached(
+        entry.id,
+        entry.action,
+        entry.amount,
+        entry.source,
+        entry.destination,
+        entry.description,
+        entry.created_at,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_entry_cached(
+    entry_id: Optional[int],
+    action: str,
+    amount: float,
+    source: Optional[str],
+    destination: Optional[str],
+    description: Optional[str],
+    created_at: datetime,
+) -> str:
+    """
+    Format ledger entry fields, memoized on the full field tuple.
+
+    Every displayed field is part of the cache key, so an edited entry
+    produces a new key instead of returning a stale string.
+    """
+    return ENTRY_ROW(
+        id=entry_id,
+        emoji=ACTION_EMOJI.get(action, "💰"),
+        action=action,
+        amount=amount,
+        source=source or "-",
+        destination=destination or "-",
+        description=description or "-",
+        # "YYYY-MM-DD HH:MM" via isoformat, which is cheaper than strftime
+        created_at=created_at.isoformat(" ", "minutes")[:16],
     )
 
 
+def _short_name(name: Optional[str]) -> str:
+    """Truncate an account name to fit an 18-character, code-block column."""
+    return name[:18].translate(CODE_BLOCK_UNSAFE) if name else "Unknown"
+
+
+def add_table_fields(embed: discord.Embed, name: str, lines: list[str]) -> bool:
+    """
+    Add table lines to an embed as code-block fields.
+
+    Lines are split across consecutive fields so that each stays within
+    Discord's field value limit.
+
+    Returns:
+        False if the embed ran out of room and some lines were left out
+    """
+    chunks: list[list[str]] = [[]]
+    size = len("```\n```")
+    for line in lines:
+        if chunks[-1] and size + len(line) + 1 > EMBED_FIELD_VALUE_LIMIT:
+            chunks.append([])
+            size = len("```\n```")
+        chunks[-1].append(line)
+        size += len(line) + 1
+
+    for index, chunk in enumerate(chunks):
+        field_name = name if index == 0 else "\u200b"
+        value = "```\n" + "\n".join(chunk) + "\n```"
+        if (
+            len(embed.fields) >= EMBED_MAX_FIELDS
+            or len(embed) + len(field_name) + len(value) > EMBED_TOTAL_LIMIT
+        ):
+            return False
+        embed.add_field(name=field_name, value=value, inline=False)
+    return True
+
+
 def format_account_type(account_type: AccountType) -> str:
     """Format account type with emoji."""
-    type_emoji = {
-        AccountType.ASSET: "💰",
-        AccountType.LIABILITY: "📋",
-        AccountType.EQUITY: "🏦",
-        AccountType.REVENUE: "📈",
-        AccountType.EXPENSE: "📉",
-    }
-    emoji = type_emoji.get(account_type, "📄")
+    emoji = ACCOUNT_TYPE_EMOJI.get(account_type, "📄")
     return f"{emoji} {account_type.value.title()}"
 
 
 class LedgerCog(commands.Cog):
     """Cog for ledger viewing and management functionality."""
 
+    __slots__ = (
+        "bot",
+        "repository",
+        "_snapshot_cache",
+        "_snapshot_generations",
+        "_users_with_entries",
+    )
+
     def __init__(self, bot: commands.Bot, repository: LedgerRepository):
         self.bot = bot
         self.repository = repository
+        # user_id -> (monotonic timestamp, financial snapshot)
+        self._snapshot_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        # user_id -> ledger updates seen, so a snapshot read before an
+        # update isn't cached after it
+        self._snapshot_generations: dict[str, int] = {}
+        # Users who may have ledger entries; anyone absent has none
+        self._users_with_entries: set[str] = set()
+
+    async def cog_load(self):
+        """Load the set of users with ledger entries."""
+        self._users_with_entries.update(
+            await self._run(self.repository.get_user_ids_with_entries)
+        )
+        logger.info("Loaded %s users with entries", len(self._users_with_entries))
 
     def _is_dm(self, interaction: discord.Interaction) -> bool:
         """Check if interaction is in a DM."""
         return interaction.guild is None
 
+    async def _run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking repository call in a worker thread."""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _snapshot(self, user_id: str) -> dict[str, Any]:
+        """
+        Get the user's financial reports, reusing a recent snapshot if available.
+
+        The trial balance, income statement and balance sheet share one
+        repository call, so running the report commands back-to-back only
+        aggregates the ledger once.
+        """
+        now = time.monotonic()
+        cached = self._snapshot_cache.get(user_id)
+        if cached and now - cached[0] < SNAPSHOT_CACHE_TTL:
+            return cached[1]
+
+        generation = self._snapshot_generations.get(user_id, 0)
+        snapshot = await self._run(self.repository.get_financial_snapshot, user_id)
+        if self._snapshot_generations.get(user_id, 0) != generation:
+            # The ledger changed while the query ran
+            return snapshot
+
+        # Drop expired snapshots so the cache only holds recent users
+        expired = [
+            uid
+            for uid, (stamp, _) in self._snapshot_cache.items()
+            if now - stamp >= SNAPSHOT_CACHE_TTL
+        ]
+        for uid in expired:
+            del self._snapshot_cache[uid]
+
+        self._snapshot_cache[user_id] = (now, snapshot)
+        return snapshot
+
+    @commands.Cog.listener()
+    async def on_ledger_updated(self, user_id: str):
+        """Drop cached reports for a user whose ledger has changed."""
+        self._snapshot_cache.pop(user_id, None)
+        self._snapshot_generations[user_id] = (
+            self._snapshot_generations.get(user_id, 0) + 1
+        )
+        self._users_with_entries.add(user_id)
+
+    async def _delete_with_retry(
+        self, entry_id: int, user_id: str
+    ) -> Optional[LedgerEntry]:
+        """
+        Delete an entry, retrying transient database errors with backoff.
+
+        Lock contention is retried up to DELETE_MAX_ATTEMPTS times with jittered
+        exponential backoff; any other error is raised immediately.
+        """
+        for attempt in range(DELETE_MAX_ATTEMPTS):
+            try:
+                return await self._run(self.repository.delete_entry, entry_id, user_id)
+            except sqlite3.OperationalError as e:
+                if attempt == DELETE_MAX_ATTEMPTS - 1 or not is_transient_db_error(e):
+                    raise
+                logger.warning(
+                    "Retrying delete of entry %s attempt=%s error=%s",
+                    entry_id,
+                    attempt + 1,
+                    e,
+                )
+                await asyncio.sleep(
+                    random.uniform(0, DELETE_RETRY_BASE_DELAY * (2**attempt))
+                )
+        return None
+
     @app_commands.command(name="history", description="View your transaction history")
     @app_commands.describe(
         limit="Number of entries to show (default: 10, max: 25)",
         action="Filter by action type",
+        page="Page of older entries to show (default: 1)",
     )
     @app_commands.choices(
         action=[
@@ -251,74 +520,89 @@ class LedgerCog(commands.Cog):
         interaction: discord.Interaction,
         limit: int = 10,
         action: str = "all",
+        page: int = 1,
     ):
         """Show transaction history for the user."""
         try:
             user_id = str(interaction.user.id)
             limit = min(max(1, limit), 25)  # Clamp between 1 and 25
+            page = max(1, page)
+            offset = (page - 1) * limit
 
             action_filter = None
             if action != "all":
-                try:
-                    action_filter = TransactionAction(action)
-                except ValueError:
+                action_filter = ACTION_LOOKUP.get(action)
+                if action_filter is None:
                     await interaction.response.send_message(
                         f"❌ Invalid action type: {action}",
                         ephemeral=True,
                     )
                     return
 
-            entries = self.repository.get_user_entries(
+            is_dm = self._is_dm(interaction)
+            await interaction.response.defer(ephemeral=not is_dm)
+
+            entries, total = await self._run(
+                self.repository.get_user_entries_with_total,
                 user_id=user_id,
                 limit=limit,
+                offset=offset,
                 action=action_filter,
             )
 
-            is_dm = self._is_dm(interaction)
-
             if not entries:
-                await interaction.response.send_message(
-                    "📭 No transactions found. Start by recording some transactions!",
-                    ephemeral=not is_dm,
-                )
-                logger.debug(f"No history found for user {user_id}")
+                if total:
+                    message = (
+                        f"📭 Page {page} is empty. You have {total} transactions "
+                        f"({(total + limit - 1) // limit} pages of {limit})."
+                    )
+                else:
+                    message = (
+                        "📭 No transactions found. "
+                        "Start by recording some transactions!"
+                    )
+                await interaction.followup.send(message, ephemeral=not is_dm)
+                logger.debug("No history found for user %s page %s", user_id, page)
                 return
 
-            total = self.repository.count_user_entries(user_id, action_filter)
-            lines = [
-                f"📜 **Transaction History** (showing {len(entries)} of {total}):\n"
-            ]
+            if offset:
+                shown = f"{offset + 1}-{offset + len(entries)}"
+            else:
+                shown = str(len(entries))
+            header = f"📜 **Transaction History** (showing {shown} of {total}):\n"
 
+            # Discord has a 2000 character limit; stop at the last whole entry
+            # that fits instead of formatting everything and cutting mid-line
+            lines = [header]
+            total_len = len(header)
             for entry in entries:
-                lines.append(format_entry(entry))
+                line = format_entry(entry)
+                if total_len + 1 + len(line) > 1996:
+                    lines.append("...")
+                    logger.warning("History message truncated for user %s", user_id)
+                    break
+                lines.append(line)
+                total_len += 1 + len(line)
 
             message = "\n".join(lines)
-            # Discord has a 2000 character limit
-            if len(message) > 2000:
-                message = message[:1997] + "..."
-                logger.warning(f"History message truncated for user {user_id}")
 
-            await interaction.response.send_message(message, ephemeral=not is_dm)
-            logger.info(f"Showed {len(entries)} history entries for user {user_id}")
+            await interaction.followup.send(message, ephemeral=not is_dm)
+            logger.info("Showed %s history entries for user %s", len(entries), user_id)
         except ValueError as e:
-            logger.warning(f"Validation error in history_command: {e}")
-            await interaction.response.send_message(
+            logger.warning("Validation error in history_command: %s", e)
+            await safe_respond(
+                interaction,
                 f"❌ Invalid input: {str(e)}",
                 ephemeral=not self._is_dm(interaction),
             )
         except Exception as e:
-            logger.error(f"Error in history_command: {e}", exc_info=True)
+            logger.error("Error in history_command: %s", e, exc_info=True)
             error_msg = (
                 "❌ An error occurred while retrieving your history. Please try again."
             )
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
-            else:
-                await interaction.response.send_message(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
+            await safe_respond(
+                interaction, error_msg, ephemeral=not self._is_dm(interaction)
+            )
 
     @app_commands.command(name="summary", description="View your ledger summary")
     async def summary_command(self, interaction: discord.Interaction):
@@ -326,64 +610,58 @@ class LedgerCog(commands.Cog):
         try:
             is_dm = self._is_dm(interaction)
             user_id = str(interaction.user.id)
-            summary = self.repository.get_user_summary(user_id)
 
-            if summary["total_entries"] == 0:
+            # Users who never recorded anything can be answered without a query
+            if user_id not in self._users_with_entries:
                 await interaction.response.send_message(
                     "📭 No transactions found. Start by recording some transactions!",
                     ephemeral=not is_dm,
                 )
-                logger.debug(f"No summary data for user {user_id}")
+                logger.debug("No summary data for user %s", user_id)
                 return
 
-            incoming = summary["incoming"]
-            outgoing = summary["outgoing"]
-            transfer = summary["transfer"]
-            net = summary["net"]
-
-            net_emoji = "📈" if net >= 0 else "📉"
-
-            inc_total = f"{incoming['total']:,.0f}"
-            out_total = f"{outgoing['total']:,.0f}"
-            tfr_total = f"{transfer['total']:,.0f}"
-            net_total = f"{net:,.0f}"
+            await interaction.response.defer(ephemeral=not is_dm)
+            summary = await self._run(self.repository.get_user_summary, user_id)
 
-            lines = [
-                "📊 **Ledger Summary**",
-                "```",
-                f"📥 Incoming:  {incoming['count']:>4} entries | {inc_total:>15}",
-                f"📤 Outgoing:  {outgoing['count']:>4} entries | {out_total:>15}",
-                f"🔄 Transfer:  {transfer['count']:>4} entries | {tfr_total:>15}",
-                "─" * 45,
-                f"{net_emoji} Net:                        | {net_total:>15}",
-                "```",
-            ]
+            if summary["total_entries"] == 0:
+                await interaction.followup.send(
+                    "📭 No transactions found. Start by recording some transactions!",
+                    ephemeral=not is_dm,
+                )
+                logger.debug("No summary data for user %s", user_id)
+                return
 
-            await interaction.response.send_message(
-                "\n".join(lines), ephemeral=not is_dm
+            net = summary["net"]
+            message = SUMMARY_MESSAGE(
+                incoming=summary["incoming"],
+                outgoing=summary["outgoing"],
+                transfer=summary["transfer"],
+                rule=SUMMARY_RULE,
+                net_emoji="📈" if net >= 0 else "📉",
+                net=net,
             )
+
+            await interaction.followup.send(message, ephemeral=not is_dm)
             logger.info(
-                f"Showed summary for user {user_id}: {summary['total_entries']} entries"
+                "Showed summary for user %s: %s entries",
+                user_id,
+                summary["total_entries"],
             )
         except ValueError as e:
-            logger.warning(f"Validation error in summary_command: {e}")
-            await interaction.response.send_message(
+            logger.warning("Validation error in summary_command: %s", e)
+            await safe_respond(
+                interaction,
                 f"❌ Invalid input: {str(e)}",
                 ephemeral=not self._is_dm(interaction),
             )
         except Exception as e:
-            logger.error(f"Error in summary_command: {e}", exc_info=True)
+            logger.error("Error in summary_command: %s", e, exc_info=True)
             error_msg = (
                 "❌ An error occurred while retrieving your summary. Please try again."
             )
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
-            else:
-                await interaction.response.send_message(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
+            await safe_respond(
+                interaction, error_msg, ephemeral=not self._is_dm(interaction)
+            )
 
     @app_commands.command(name="balance", description="View balances by account")
     async def balance_command(self, interaction: discord.Interaction):
@@ -392,67 +670,54 @@ class LedgerCog(commands.Cog):
             is_dm = self._is_dm(interaction)
             user_id = str(interaction.user.id)
 
+            await interaction.response.defer(ephemeral=not is_dm)
+
             # Get balance sheet which properly categorizes accounts
-            balance_sheet = self.repository.get_balance_sheet(user_id)
+            balance_sheet = (await self._snapshot(user_id))["balance_sheet"]
 
             if not balance_sheet or not balance_sheet.get("assets"):
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "📭 No asset accounts found. Start by recording some transactions!",
                     ephemeral=not is_dm,
                 )
-                logger.debug(f"No asset balances found for user {user_id}")
+                logger.debug("No asset balances found for user %s", user_id)
                 return
 
-            # Get assets sorted by balance descending
-            assets = sorted(
-                balance_sheet["assets"],
-                key=lambda x: x["amount"],
-                reverse=True,
-            )
-
-            lines = ["💰 **Your Pockets/Wallets**", "```"]
-
-            for asset in assets:
-                name = asset["name"][:18] if asset["name"] else "Unknown"
-                amount = asset["amount"]
-                # Format with Rp prefix
-                amount_str = f"Rp {amount:>14,.0f}"
-                lines.append(f"{name:<18} | {amount_str}")
-
-            lines.append("```")
-
-            # Add total
-            total_assets = balance_sheet["total_assets"]
-            lines.append(f"\n💵 **Total Balance:** Rp {total_assets:,.0f}")
+            # Assets arrive sorted by balance descending; show the largest ones
+            assets = balance_sheet["assets"][:BALANCE_MAX_ACCOUNTS]
 
-            message = "\n".join(lines)
+            message = BALANCE_MESSAGE(
+                rows="\n".join(
+                    BALANCE_ROW(name=_short_name(asset["name"]), amount=asset["amount"])
+                    for asset in assets
+                ),
+                total=balance_sheet["total_assets"],
+            )
             if len(message) > 2000:
                 message = message[:1997] + "..."
-                logger.warning(f"Balance message truncated for user {user_id}")
+                logger.warning("Balance message truncated for user %s", user_id)
 
-            await interaction.response.send_message(message, ephemeral=not is_dm)
+            await interaction.followup.send(message, ephemeral=not is_dm)
             logger.info(
-                f"Showed balances for {len(assets)} asset accounts for user {user_id}"
+                "Showed balances for %s asset accounts for user %s",
+                len(assets),
+                user_id,
             )
         except ValueError as e:
-            logger.warning(f"Validation error in balance_command: {e}")
-            await interaction.response.send_message(
+            logger.warning("Validation error in balance_command: %s", e)
+            await safe_respond(
+                interaction,
                 f"❌ Invalid input: {str(e)}",
                 ephemeral=not self._is_dm(interaction),
             )
         except Exception as e:
-            logger.error(f"Error in balance_command: {e}", exc_info=True)
+            logger.error("Error in balance_command: %s", e, exc_info=True)
             error_msg = (
                 "❌ An error occurred while retrieving your balances. Please try again."
             )
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
-            else:
-                await interaction.response.send_message(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
+            await safe_respond(
+                interaction, error_msg, ephemeral=not self._is_dm(interaction)
+            )
 
     @app_commands.command(
         name="trial_balance", description="View trial balance (debits vs credits)"
@@ -462,44 +727,53 @@ class LedgerCog(commands.Cog):
         try:
             is_dm = self._is_dm(interaction)
             user_id = str(interaction.user.id)
-            trial_balance = self.repository.get_trial_balance(user_id)
+            await interaction.response.defer(ephemeral=not is_dm)
+            trial_balance = (await self._snapshot(user_id))["trial_balance"]
 
             if not trial_balance["accounts"]:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "📭 No transactions found to generate trial balance.",
                     ephemeral=not is_dm,
                 )
                 return
 
-            lines = ["⚖️ **Trial Balance**", "```"]
-            lines.append(f"{'Account':<20} {'Debit':>12} {'Credit':>12}")
-            lines.append("─" * 46)
-
-            for acc in trial_balance["accounts"]:
-                debit = f"{acc['debit']:,.0f}" if acc["debit"] else "-"
-                credit = f"{acc['credit']:,.0f}" if acc["credit"] else "-"
-                lines.append(f"{acc['name']:<20} {debit:>12} {credit:>12}")
+            is_balanced = trial_balance["is_balanced"]
+            if is_balanced:
+                status = "✅ **Balanced!** Debits equal Credits"
+            else:
+                diff = trial_balance["difference"]
+                status = f"⚠️ **Unbalanced!** Difference: {diff:,.0f}"
+            embed = discord.Embed(
+                title="⚖️ Trial Balance",
+                description=status,
+                color=discord.Color.green() if is_balanced else discord.Color.orange(),
+            )
 
-            lines.append("─" * 46)
+            lines = [TRIAL_BALANCE_HEADER, TRIAL_BALANCE_RULE]
+            lines.extend(
+                TRIAL_BALANCE_ROW(
+                    name=name,
+                    debit=f"{acc['debit']:,.0f}" if acc["debit"] else "-",
+                    credit=f"{acc['credit']:,.0f}" if acc["credit"] else "-",
+                )
+                for name, acc in trial_balance["accounts"].items()
+            )
+            lines.append(TRIAL_BALANCE_RULE)
             total_dr = f"{trial_balance['total_debits']:,.0f}"
             total_cr = f"{trial_balance['total_credits']:,.0f}"
-            lines.append(f"{'TOTAL':<20} {total_dr:>12} {total_cr:>12}")
-            lines.append("```")
+            lines.append(
+                TRIAL_BALANCE_ROW(name="TOTAL", debit=total_dr, credit=total_cr)
+            )
 
-            # Balance status
-            if trial_balance["is_balanced"]:
-                lines.append("✅ **Balanced!** Debits equal Credits")
-            else:
-                diff = trial_balance["difference"]
-                lines.append(f"⚠️ **Unbalanced!** Difference: {diff:,.0f}")
+            if not add_table_fields(embed, "Accounts", lines):
+                embed.set_footer(text=EMBED_TRUNCATED_NOTE)
 
-            await interaction.response.send_message(
-                "\n".join(lines), ephemeral=not is_dm
-            )
-            logger.info(f"Showed trial balance for user {user_id}")
+            await interaction.followup.send(embed=embed, ephemeral=not is_dm)
+            logger.info("Showed trial balance for user %s", user_id)
         except Exception as e:
-            logger.error(f"Error in trial_balance_command: {e}", exc_info=True)
-            await interaction.response.send_message(
+            logger.error("Error in trial_balance_command: %s", e, exc_info=True)
+            await safe_respond(
+                interaction,
                 "❌ An error occurred while generating trial balance.",
                 ephemeral=not self._is_dm(interaction),
             )
@@ -512,55 +786,46 @@ class LedgerCog(commands.Cog):
         try:
             is_dm = self._is_dm(interaction)
             user_id = str(interaction.user.id)
-            income_stmt = self.repository.get_income_statement(user_id)
+            await interaction.response.defer(ephemeral=not is_dm)
+            income_stmt = (await self._snapshot(user_id))["income_statement"]
 
             if not income_stmt["revenue"] and not income_stmt["expenses"]:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "📭 No income or expense transactions found.",
                     ephemeral=not is_dm,
                 )
                 return
 
-            lines = ["📊 **Income Statement (Profit & Loss)**", ""]
-
-            # Revenue section
-            lines.append("**📈 Revenue**")
-            if income_stmt["revenue"]:
-                for item in income_stmt["revenue"]:
-                    lines.append(f"  {item['name']:<20} {item['amount']:>12,.0f}")
-            else:
-                lines.append("  _(no revenue)_")
-            lines.append(
-                f"  **{'Total Revenue':<20} {income_stmt['total_revenue']:>12,.0f}**"
-            )
-            lines.append("")
-
-            # Expense section
-            lines.append("**📉 Expenses**")
-            if income_stmt["expenses"]:
-                for item in income_stmt["expenses"]:
-                    lines.append(f"  {item['name']:<20} {item['amount']:>12,.0f}")
-            else:
-                lines.append("  _(no expenses)_")
-            lines.append(
-                f"  **{'Total Expenses':<20} {income_stmt['total_expenses']:>12,.0f}**"
-            )
-            lines.append("")
-
-            # Net income
             net = income_stmt["net_income"]
             emoji = "✅" if net >= 0 else "⚠️"
             status = "Profit" if net >= 0 else "Loss"
-            lines.append("─" * 35)
-            lines.append(f"{emoji} **Net {status}: {net:,.0f}**")
-
-            await interaction.response.send_message(
-                "\n".join(lines), ephemeral=not is_dm
+            embed = discord.Embed(
+                title="📊 Income Statement (Profit & Loss)",
+                description=f"{emoji} **Net {status}: {net:,.0f}**",
+                color=discord.Color.green() if net >= 0 else discord.Color.orange(),
             )
-            logger.info(f"Showed income statement for user {user_id}")
+
+            complete = True
+            for title, key, empty_text, total_label in INCOME_STATEMENT_SECTIONS:
+                lines = [INCOME_STATEMENT_ROW(**item) for item in income_stmt[key]]
+                if not lines:
+                    lines.append(f"  {empty_text}")
+                lines.append(
+                    INCOME_STATEMENT_ROW(
+                        name=total_label, amount=income_stmt[f"total_{key}"]
+                    )
+                )
+                complete = add_table_fields(embed, title, lines) and complete
+
+            if not complete:
+                embed.set_footer(text=EMBED_TRUNCATED_NOTE)
+
+            await interaction.followup.send(embed=embed, ephemeral=not is_dm)
+            logger.info("Showed income statement for user %s", user_id)
         except Exception as e:
-            logger.error(f"Error in income_statement_command: {e}", exc_info=True)
-            await interaction.response.send_message(
+            logger.error("Error in income_statement_command: %s", e, exc_info=True)
+            await safe_respond(
+                interaction,
                 "❌ An error occurred while generating income statement.",
                 ephemeral=not self._is_dm(interaction),
             )
@@ -574,7 +839,8 @@ class LedgerCog(commands.Cog):
         try:
             is_dm = self._is_dm(interaction)
             user_id = str(interaction.user.id)
-            balance_sheet = self.repository.get_balance_sheet(user_id)
+            await interaction.response.defer(ephemeral=not is_dm)
+            balance_sheet = (await self._snapshot(user_id))["balance_sheet"]
 
             if not any(
                 [
@@ -583,65 +849,52 @@ class LedgerCog(commands.Cog):
                     balance_sheet["equity"],
                 ]
             ):
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "📭 No data found to generate balance sheet.",
                     ephemeral=not is_dm,
                 )
                 return
 
-            lines = ["🏦 **Balance Sheet**", "```"]
-
-            # Assets section
-            lines.append("💰 Assets")
-            if balance_sheet["assets"]:
-                for item in balance_sheet["assets"]:
-                    name = item["name"][:18] if item["name"] else "Unknown"
-                    amount_str = f"Rp {item['amount']:>14,.0f}"
-                    lines.append(f"  {name:<18} {amount_str}")
-            else:
-                lines.append("  (no assets)")
-            total_assets_str = f"Rp {balance_sheet['total_assets']:>14,.0f}"
-            lines.append(f"  {'Total Assets':<18} {total_assets_str}")
-            lines.append("")
-
-            # Liabilities section
-            lines.append("📋 Liabilities")
-            if balance_sheet["liabilities"]:
-                for item in balance_sheet["liabilities"]:
-                    name = item["name"][:18] if item["name"] else "Unknown"
-                    amount_str = f"Rp {item['amount']:>14,.0f}"
-                    lines.append(f"  {name:<18} {amount_str}")
-            else:
-                lines.append("  (no liabilities)")
-            total_liab_str = f"Rp {balance_sheet['total_liabilities']:>14,.0f}"
-            lines.append(f"  {'Total Liabilities':<18} {total_liab_str}")
-            lines.append("")
-
-            # Equity section
-            lines.append("🏛️ Equity (incl. Retained Earnings)")
-            if balance_sheet["equity"]:
-                for item in balance_sheet["equity"]:
-                    name = item["name"][:18] if item["name"] else "Unknown"
-                    amount_str = f"Rp {item['amount']:>14,.0f}"
-                    lines.append(f"  {name:<18} {amount_str}")
-            total_equity_str = f"Rp {balance_sheet['total_equity']:>14,.0f}"
-            lines.append(f"  {'Total Equity':<18} {total_equity_str}")
-            lines.append("```")
-
-            # Balance check
-            if balance_sheet["is_balanced"]:
-                lines.append("✅ **Accounting equation balanced!**")
-                lines.append("Assets = Liabilities + Equity")
+            is_balanced = balance_sheet["is_balanced"]
+            if is_balanced:
+                status = (
+                    "✅ **Accounting equation balanced!**\n"
+                    "Assets = Liabilities + Equity"
+                )
             else:
-                lines.append("⚠️ **Warning: Equation not balanced**")
-
-            await interaction.response.send_message(
-                "\n".join(lines), ephemeral=not is_dm
+                status = "⚠️ **Warning: Equation not balanced**"
+            embed = discord.Embed(
+                title="🏦 Balance Sheet",
+                description=status,
+                color=discord.Color.green() if is_balanced else discord.Color.orange(),
             )
-            logger.info(f"Showed balance sheet for user {user_id}")
+
+            complete = True
+            for title, key, empty_text, total_label in BALANCE_SHEET_SECTIONS:
+                lines = [
+                    BALANCE_SHEET_ROW(
+                        name=_short_name(item["name"]), amount=item["amount"]
+                    )
+                    for item in balance_sheet[key]
+                ]
+                if not lines and empty_text:
+                    lines.append(f"  {empty_text}")
+                lines.append(
+                    BALANCE_SHEET_ROW(
+                        name=total_label, amount=balance_sheet[f"total_{key}"]
+                    )
+                )
+                complete = add_table_fields(embed, title, lines) and complete
+
+            if not complete:
+                embed.set_footer(text=EMBED_TRUNCATED_NOTE)
+
+            await interaction.followup.send(embed=embed, ephemeral=not is_dm)
+            logger.info("Showed balance sheet for user %s", user_id)
         except Exception as e:
-            logger.error(f"Error in balance_sheet_command: {e}", exc_info=True)
-            await interaction.response.send_message(
+            logger.error("Error in balance_sheet_command: %s", e, exc_info=True)
+            await safe_respond(
+                interaction,
                 "❌ An error occurred while generating balance sheet.",
                 ephemeral=not self._is_dm(interaction),
             )
@@ -664,7 +917,7 @@ class LedgerCog(commands.Cog):
                 return
 
             # Get the existing entry
-            entry = self.repository.get_by_id(entry_id)
+            entry = await self._run(self.repository.get_by_id, entry_id)
 
             if not entry:
                 await interaction.response.send_message(
@@ -680,7 +933,10 @@ class LedgerCog(commands.Cog):
                     ephemeral=not is_dm,
                 )
                 logger.warning(
-                    f"User {user_id} attempted to edit entry {entry_id} owned by {entry.user_id}"
+                    "User %s attempted to edit entry %s owned by %s",
+                    user_id,
+                    entry_id,
+                    entry.user_id,
                 )
                 return
 
@@ -696,27 +952,23 @@ class LedgerCog(commands.Cog):
             )
 
             await interaction.response.send_modal(modal)
-            logger.info(f"Opened edit modal for entry {entry_id} for user {user_id}")
+            logger.info("Opened edit modal for entry %s for user %s", entry_id, user_id)
 
         except ValueError as e:
-            logger.warning(f"Validation error in edit_command: {e}")
-            await interaction.response.send_message(
+            logger.warning("Validation error in edit_command: %s", e)
+            await safe_respond(
+                interaction,
                 f"❌ Invalid input: {str(e)}",
                 ephemeral=not self._is_dm(interaction),
             )
         except Exception as e:
-            logger.error(f"Error in edit_command: {e}", exc_info=True)
+            logger.error("Error in edit_command: %s", e, exc_info=True)
             error_msg = (
                 "❌ An error occurred while preparing the edit form. Please try again."
             )
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
-            else:
-                await interaction.response.send_message(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
+            await safe_respond(
+                interaction, error_msg, ephemeral=not self._is_dm(interaction)
+            )
 
     @app_commands.command(name="delete", description="Delete a transaction")
     @app_commands.describe(entry_id="The ID of the transaction to delete")
@@ -734,66 +986,59 @@ class LedgerCog(commands.Cog):
                 return
 
             user_id = str(interaction.user.id)
+            await interaction.response.defer(ephemeral=not is_dm)
 
-            # Get entry first to show what's being deleted
-            entry = self.repository.get_by_id(entry_id)
+            deleted = await self._delete_with_retry(entry_id, user_id)
+
+            if deleted:
+                self.bot.dispatch("ledger_updated", user_id)
+                entry_text = format_entry(deleted)
+                await interaction.followup.send(
+                    f"🗑️ Deleted transaction `#{entry_id}` (and associated journal entries):\n{entry_text}",
+                    ephemeral=not is_dm,
+                )
+                logger.info("User %s deleted entry %s", user_id, entry_id)
+                return
+
+            # Nothing was deleted; look the entry up only to explain why
+            entry = await self._run(self.repository.get_by_id, entry_id)
 
             if not entry:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     f"❌ Transaction `#{entry_id}` not found.",
                     ephemeral=not is_dm,
                 )
                 logger.debug(
-                    f"Entry {entry_id} not found for deletion by user {user_id}"
+                    "Entry %s not found for deletion by user %s", entry_id, user_id
                 )
-                return
-
-            if entry.user_id != user_id:
-                await interaction.response.send_message(
+            else:
+                await interaction.followup.send(
                     "❌ You can only delete your own transactions.",
                     ephemeral=not is_dm,
                 )
                 logger.warning(
-                    f"User {user_id} attempted to delete entry {entry_id} owned by {entry.user_id}"
-                )
-                return
-
-            deleted = self.repository.delete_entry(entry_id, user_id)
-
-            if deleted:
-                await interaction.response.send_message(
-                    f"🗑️ Deleted transaction `#{entry_id}` (and associated journal entries):\n{format_entry(entry)}",
-                    ephemeral=not is_dm,
+                    "User %s attempted to delete entry %s owned by %s",
+                    user_id,
+                    entry_id,
+                    entry.user_id,
                 )
-                logger.info(f"User {user_id} deleted entry {entry_id}")
-            else:
-                await interaction.response.send_message(
-                    f"❌ Failed to delete transaction `#{entry_id}`.",
-                    ephemeral=not is_dm,
-                )
-                logger.error(f"Failed to delete entry {entry_id} for user {user_id}")
         except ValueError as e:
-            logger.warning(f"Validation error in delete_command: {e}")
-            await interaction.response.send_message(
+            logger.warning("Validation error in delete_command: %s", e)
+            await safe_respond(
+                interaction,
                 f"❌ Invalid input: {str(e)}",
                 ephemeral=not self._is_dm(interaction),
             )
         except Exception as e:
-            logger.error(f"Error in delete_command: {e}", exc_info=True)
+            logger.error("Error in delete_command: %s", e, exc_info=True)
             error_msg = (
                 "❌ An error occurred while deleting the transaction. Please try again."
             )
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
-            else:
-                await interaction.response.send_message(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
+            await safe_respond(
+                interaction, error_msg, ephemeral=not self._is_dm(interaction)
+            )
 
 
 async def setup(bot: commands.Bot):
     """Setup function for loading the cog."""
-    # This will be called with proper dependencies from the main bot setup
-    pass
+    await bot.add_cog(LedgerCog(bot, bot.repository))
@@ -5,46 +5,80 @@ Handles the /parse command and on_message event for natural language
 transaction parsing.
 """
 
+import asyncio
+import dataclasses
 import logging
+import os
+import re
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Optional
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from yuuka.db import LedgerRepository
+from yuuka.db import LedgerEntry, LedgerRepository
 from yuuka.models import ParsedTransaction, TransactionAction
-from yuuka.services import TransactionNLPService
+from yuuka.services import (
+    TransactionNLPService,
+    init_parse_worker,
+    parse_batch_in_worker,
+)
+
+from ..utils import safe_respond
 
 logger = logging.getLogger(__name__)
 
 # Confidence threshold below which we ask for user confirmation
 LOW_CONFIDENCE_THRESHOLD = 0.7
 
+# Messages waiting to be parsed, how many are parsed per NLP call, and how
+# long (seconds) a batch waits for more messages before being parsed
+NLP_QUEUE_MAXSIZE = 256
+NLP_BATCH_SIZE = 32
+NLP_BATCH_WINDOW = 0.02
 
-def format_transaction(parsed: ParsedTransaction) -> str:
-    """Format a parsed transaction for display in Discord."""
-    action_emoji = {
-        TransactionAction.INCOMING: "📥",
-        TransactionAction.OUTGOING: "📤",
-        TransactionAction.TRANSFER: "🔄",
-    }
+# Worker processes running spaCy outside the GIL; each loads its own model
+NLP_PROCESS_WORKERS = min(4, os.cpu_count() or 1)
+
+# Every amount format contains a digit, so text without one can't be valid
+HAS_DIGIT = re.compile(r"\d").search
+
+# on_message replies in a channel are collected for this long (seconds) and
+# sent together, up to this many characters per combined message
+REPLY_COALESCE_WINDOW = 0.15
+REPLY_COALESCE_LIMIT = 1800
+
+# Row template for the balances shown after recording a transaction
+ASSET_BALANCE_ROW = "{name:<18} | Rp {amount:>14,.0f}".format
 
-    emoji = action_emoji.get(parsed.action, "💰")
-    amount_str = f"{parsed.amount:,.0f}" if parsed.amount else "N/A"
+# Number of recent parse results kept, keyed by case-folded normalized text
+PARSE_CACHE_SIZE = 1024
 
-    lines = [
-        f"{emoji} **{parsed.action.value.upper()}**",
-        "```",
-        f"Amount:      {amount_str}",
-        f"Source:      {parsed.source or '-'}",
-        f"Destination: {parsed.destination or '-'}",
-        f"Description: {parsed.description or '-'}",
-        f"Confidence:  {parsed.confidence:.0%}",
-        "```",
-    ]
+ACTION_EMOJI = {
+    TransactionAction.INCOMING: "📥",
+    TransactionAction.OUTGOING: "📤",
+    TransactionAction.TRANSFER: "🔄",
+}
 
-    return "\n".join(lines)
+
+def format_transaction(parsed: ParsedTransaction) -> str:
+    """Format a parsed transaction for display in Discord."""
+    amount = f"{parsed.amount:,.0f}" if parsed.amount else "N/A"
+
+    # One f-string rather than a joined list of lines
+    return (
+        f"{ACTION_EMOJI.get(parsed.action, '💰')} **{parsed.action.value.upper()}**\n"
+        "```\n"
+        f"Amount:      {amount}\n"
+        f"Source:      {parsed.source or '-'}\n"
+        f"Destination: {parsed.destination or '-'}\n"
+        f"Description: {parsed.description or '-'}\n"
+        f"Confidence:  {parsed.confidence:.0%}\n"
+        "```"
+    )
 
 
 def format_asset_balances(repository: LedgerRepository, user_id: str) -> Optional[str]:
@@ -65,27 +99,51 @@ def format_asset_balances(repository: LedgerRepository, user_id: str) -> Optiona
         if not assets:
             return None
 
-        lines = ["", "💰 **Current Balances**", "```"]
-
-        for asset in assets:
-            name = asset["name"][:18] if asset["name"] else "Unknown"
-            amount = asset["amount"]
-            # Format with Rp prefix
-            amount_str = f"Rp {amount:>14,.0f}"
-            lines.append(f"{name:<18} | {amount_str}")
-
-        lines.append("```")
-
-        # Add total
-        total_assets = balance_sheet["total_assets"]
-        lines.append(f"💵 **Total:** Rp {total_assets:,.0f}")
-
-        return "\n".join(lines)
+        rows = "\n".join(
+            ASSET_BALANCE_ROW(
+                name=asset["name"][:18] if asset["name"] else "Unknown",
+                amount=asset["amount"],
+            )
+            for asset in assets
+        )
+        return (
+            "\n💰 **Current Balances**\n"
+            f"```\n{rows}\n```\n"
+            f"💵 **Total:** Rp {balance_sheet['total_assets']:,.0f}"
+        )
     except Exception as e:
         logger.error(f"Error formatting asset balances: {e}", exc_info=True)
         return None
 
 
+def record_transaction(
+    repository: LedgerRepository,
+    parsed: ParsedTransaction,
+    user_id: str,
+    channel_id: str,
+    message_id: str,
+    guild_id: Optional[str],
+) -> tuple[LedgerEntry, Optional[str]]:
+    """
+    Save a confirmed transaction and format the user's updated balances.
+
+    Both steps block on the database, so callers run them together in a
+    worker thread.
+
+    Returns:
+        Tuple of (saved entry, formatted balances or None)
+    """
+    entry = repository.insert(
+        parsed=parsed,
+        user_id=user_id,
+        channel_id=channel_id,
+        message_id=message_id,
+        guild_id=guild_id,
+        confirmed=True,
+    )
+    return entry, format_asset_balances(repository, user_id)
+
+
 def format_low_confidence_message(parsed: ParsedTransaction) -> str:
     """Format message for low-confidence parses asking for confirmation."""
     return (
@@ -94,6 +152,23 @@ def format_low_confidence_message(parsed: ParsedTransaction) -> str:
     )
 
 
+def format_invalid_parse_message(message: str) -> str:
+    """Format the reply for a /parse message with no valid transaction."""
+    return (
+        f"❓ I couldn't parse a valid transaction from your message:\n"
+        f"```{message}```\n"
+        "Please make sure to include an amount and source/destination."
+    )
+
+
+# Reply for mentions and DMs with no valid transaction
+INVALID_MESSAGE_REPLY = (
+    "❓ I couldn't parse a valid transaction from your message.\n"
+    "Please make sure to include an amount and source/destination.\n"
+    "Use `/help` for examples."
+)
+
+
 class TransactionView(discord.ui.View):
     """View with confirmation buttons for low-confidence parses."""
 
@@ -109,9 +184,9 @@ class TransactionView(discord.ui.View):
         is_dm: bool = False,
     ):
         super().__init__(timeout=60.0)
-        self.parsed = parsed
+        self.parsed: Optional[ParsedTransaction] = parsed
         self.original_message = original_message
-        self.repository = repository
+        self.repository: Optional[LedgerRepository] = repository
         self.user_id = user_id
         self.channel_id = channel_id
         self.message_id = message_id
@@ -127,15 +202,17 @@ class TransactionView(discord.ui.View):
         try:
             self.confirmed = True
 
-            # Save to database
-            entry = self.repository.insert(
-                parsed=self.parsed,
-                user_id=self.user_id,
-                channel_id=self.channel_id,
-                message_id=self.message_id,
-                guild_id=self.guild_id,
-                confirmed=True,
+            # Save to database and fetch the updated balances off the event loop
+            entry, balances = await asyncio.to_thread(
+                record_transaction,
+                self.repository,
+                self.parsed,
+                self.user_id,
+                self.channel_id,
+                self.message_id,
+                self.guild_id,
             )
+            interaction.client.dispatch("ledger_updated", self.user_id)
 
             content = (
                 f"✅ Confirmed! Transaction recorded (ID: `{entry.id}`):\n"
@@ -143,7 +220,6 @@ class TransactionView(discord.ui.View):
             )
 
             # Add asset balances
-            balances = format_asset_balances(self.repository, self.user_id)
             if balances:
                 content += balances
 
@@ -181,8 +257,20 @@ class TransactionView(discord.ui.View):
     async def on_timeout(self):
         """Called when the view times out."""
         self.confirmed = None
+        self._release()
         logger.info(f"Transaction confirmation timed out for user {self.user_id}")
 
+    def stop(self):
+        """Stop listening for interactions and release the parse data."""
+        super().stop()
+        self._release()
+
+    def _release(self):
+        """Drop references the finished view no longer needs."""
+        self.parsed = None
+        self.original_message = ""
+        self.repository = None
+
 
 class ParsingCog(commands.Cog):
     """Cog for transaction parsing functionality."""
@@ -196,6 +284,238 @@ class ParsingCog(commands.Cog):
         self.bot = bot
         self.nlp_service = nlp_service
         self.repository = repository
+        self._parse_queue: asyncio.Queue[tuple[str, asyncio.Future]] = asyncio.Queue(
+            maxsize=NLP_QUEUE_MAXSIZE
+        )
+        self._batch_task: Optional[asyncio.Task] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._parse_cache: OrderedDict[str, ParsedTransaction] = OrderedDict()
+        # Compiled on the first mention, once bot.user is known
+        self._mention_re: Optional[re.Pattern[str]] = None
+        self._pending_replies: dict[int, list[tuple[discord.Message, str]]] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+        # Confirmation views still waiting for an answer
+        self._views: weakref.WeakSet[TransactionView] = weakref.WeakSet()
+
+    async def cog_load(self):
+        """Start the NLP worker processes and the background batch worker."""
+        self._pool = ProcessPoolExecutor(
+            max_workers=NLP_PROCESS_WORKERS,
+            initializer=init_parse_worker,
+            initargs=(self.nlp_service.model_name,),
+        )
+        self._batch_task = asyncio.create_task(self._batch_worker())
+
+    async def cog_unload(self):
+        """Stop pending confirmations, the batch worker and the NLP workers."""
+        for view in list(self._views):
+            view.stop()
+        for task in self._flush_tasks:
+            task.cancel()
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            self._batch_task = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _parse(self, content: str) -> ParsedTransaction:
+        """
+        Parse a message, reusing the result for recently seen text.
+
+        Every extracted field is derived from the lowercased text, so the
+        cache key folds case and collapses whitespace; only raw_text is
+        swapped in per message on a hit. Digits stay in the key because
+        they carry the amount. Cache misses are queued for batched parsing.
+        """
+        text = " ".join(content.split())
+        key = text.lower()
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            if cached.raw_text != text:
+                cached = dataclasses.replace(cached, raw_text=text)
+            return cached
+
+        future = asyncio.get_running_loop().create_future()
+        await self._parse_queue.put((text, future))
+        parsed = await future
+
+        # Zero confidence also covers NLP failures, which may not recur
+        if parsed.confidence > 0:
+            self._parse_cache[key] = parsed
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return parsed
+
+    def clear_parse_cache(self):
+        """Drop all cached parse results."""
+        self._parse_cache.clear()
+
+    async def _batch_worker(self):
+        """
+        Drain queued messages and parse them in batches in the process pool.
+
+        A batch collects messages for up to NLP_BATCH_WINDOW after the first
+        one arrives; messages that arrive while a batch is being parsed are
+        picked up together in the next one.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._parse_queue.get()]
+            deadline = loop.time() + NLP_BATCH_WINDOW
+            while len(batch) < NLP_BATCH_SIZE:
+                try:
+                    batch.append(self._parse_queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._parse_queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            contents = [content for content, _ in batch]
+            try:
+                results = await loop.run_in_executor(
+                    self._pool, parse_batch_in_worker, contents
+                )
+            except Exception as e:
+                logger.error(f"Error parsing message batch: {e}", exc_info=True)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), parsed in zip(batch, results):
+                if not future.done():
+                    future.set_result(parsed)
+
+    def _queue_reply(self, message: discord.Message, content: str):
+        """
+        Queue a plain-text reply to be sent with others from the same channel.
+
+        The first reply queued for a channel schedules a flush after
+        REPLY_COALESCE_WINDOW; replies queued until then go out together.
+        """
+        channel_id = message.channel.id
+        pending = self._pending_replies.setdefault(channel_id, [])
+        pending.append((message, content))
+        if len(pending) == 1:
+            task = asyncio.create_task(self._flush_replies(channel_id))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_replies(self, channel_id: int):
+        """Send a channel's queued replies, combining them where they fit."""
+        await asyncio.sleep(REPLY_COALESCE_WINDOW)
+        pending = self._pending_replies.pop(channel_id, [])
+
+        try:
+            if len(pending) == 1:
+                message, content = pending[0]
+                await message.reply(content)
+                return
+
+            # Several replies: address each to its author in shared messages
+            channel = pending[0][0].channel
+            chunk = ""
+            for message, content in pending:
+                part = f"{message.author.mention} {content}"
+                if chunk and len(chunk) + 2 + len(part) > REPLY_COALESCE_LIMIT:
+                    await channel.send(chunk)
+                    chunk = ""
+                chunk = f"{chunk}\n\n{part}" if chunk else part
+            if chunk:
+                await channel.send(chunk)
+        except discord.HTTPException as e:
+            logger.error(
+                f"Discord API error sending replies in channel {channel_id}: {e}",
+                exc_info=True,
+            )
+
+    async def _handle_transaction(
+        self,
+        content: str,
+        user_id: str,
+        channel_id: str,
+        message_id: str,
+        guild_id: Optional[str],
+        is_dm: bool,
+    ) -> tuple[Optional[str], Optional[TransactionView]]:
+        """
+        Parse a transaction message and record it or ask for confirmation.
+
+        Shared by /parse and on_message, which only differ in how the
+        result is sent.
+
+        Args:
+            content: Message text, already length-checked
+            user_id: Discord user ID
+            channel_id: Discord channel ID
+            message_id: Discord message ID
+            guild_id: Discord guild ID (None for DMs)
+            is_dm: Whether the message came from a DM
+
+        Returns:
+            Tuple of (reply, view). The view is set for low-confidence
+            parses awaiting confirmation; reply is None if no valid
+            transaction was found.
+        """
+        # No digit means no amount; skip the parser entirely
+        if not HAS_DIGIT(content):
+            return None, None
+
+        parsed = await self._parse(content)
+
+        if not parsed.is_valid():
+            return None, None
+
+        if parsed.confidence < LOW_CONFIDENCE_THRESHOLD:
+            view = TransactionView(
+                parsed=parsed,
+                original_message=content,
+                repository=self.repository,
+                user_id=user_id,
+                channel_id=channel_id,
+                message_id=message_id,
+                guild_id=guild_id,
+                is_dm=is_dm,
+            )
+            self._views.add(view)
+            logger.info(
+                f"Low confidence parse for user {user_id}, awaiting confirmation"
+            )
+            return format_low_confidence_message(parsed), view
+
+        # High confidence - save directly
+        entry, balances = await asyncio.to_thread(
+            record_transaction,
+            self.repository,
+            parsed,
+            user_id,
+            channel_id,
+            message_id,
+            guild_id,
+        )
+        self.bot.dispatch("ledger_updated", user_id)
+        logger.info(f"Transaction {entry.id} recorded for user {user_id}")
+
+        reply = (
+            f"✅ Transaction recorded (ID: `{entry.id}`):\n"
+            f"{format_transaction(parsed)}"
+        )
+
+        # Add asset balances
+        if balances:
+            reply += balances
+
+        return reply, None
 
     def _is_dm(self, interaction: discord.Interaction) -> bool:
         """Check if interaction is in a DM."""
@@ -224,94 +544,45 @@ class ParsingCog(commands.Cog):
                 )
                 return
 
-            parsed = self.nlp_service.parse(message)
-
-            if not parsed.is_valid():
-                await interaction.response.send_message(
-                    f"❓ I couldn't parse a valid transaction from your message:\n"
-                    f"```{message}```\n"
-                    "Please make sure to include an amount and source/destination.",
-                    ephemeral=not is_dm,
-                )
-                logger.info(
-                    f"Invalid transaction parse for user {interaction.user.id}: {message}"
-                )
-                return
+            await interaction.response.defer(ephemeral=not is_dm, thinking=True)
 
-            user_id = str(interaction.user.id)
-            channel_id = str(interaction.channel_id)
-            guild_id = str(interaction.guild_id) if interaction.guild_id else None
+            reply, view = await self._handle_transaction(
+                message,
+                user_id=str(interaction.user.id),
+                channel_id=str(interaction.channel_id),
+                # The reply doesn't exist yet, so the interaction ID stands in
+                message_id=str(interaction.id),
+                guild_id=str(interaction.guild_id) if interaction.guild_id else None,
+                is_dm=is_dm,
+            )
 
-            if parsed.confidence < LOW_CONFIDENCE_THRESHOLD:
-                # Send first to get message ID
-                await interaction.response.send_message(
-                    format_low_confidence_message(parsed),
+            if reply is None:
+                await interaction.followup.send(
+                    format_invalid_parse_message(message),
                     ephemeral=not is_dm,
                 )
-                response = await interaction.original_response()
-                message_id = str(response.id)
-
-                view = TransactionView(
-                    parsed=parsed,
-                    original_message=message,
-                    repository=self.repository,
-                    user_id=user_id,
-                    channel_id=channel_id,
-                    message_id=message_id,
-                    guild_id=guild_id,
-                    is_dm=is_dm,
-                )
-                await interaction.edit_original_response(view=view)
                 logger.info(
-                    f"Low confidence parse for user {user_id}, awaiting confirmation"
+                    f"Invalid transaction parse for user {interaction.user.id}: {message}"
                 )
+            elif view is not None:
+                await interaction.followup.send(reply, view=view, ephemeral=not is_dm)
             else:
-                # High confidence - save directly
-                await interaction.response.send_message(
-                    "Processing...",
-                    ephemeral=not is_dm,
-                )
-                response = await interaction.original_response()
-                message_id = str(response.id)
-
-                entry = self.repository.insert(
-                    parsed=parsed,
-                    user_id=user_id,
-                    channel_id=channel_id,
-                    message_id=message_id,
-                    guild_id=guild_id,
-                    confirmed=True,
-                )
-
-                content = (
-                    f"✅ Transaction recorded (ID: `{entry.id}`):\n"
-                    f"{format_transaction(parsed)}"
-                )
-
-                # Add asset balances
-                balances = format_asset_balances(self.repository, user_id)
-                if balances:
-                    content += balances
-
-                await interaction.edit_original_response(content=content)
-                logger.info(f"Transaction {entry.id} recorded for user {user_id}")
+                await interaction.followup.send(reply, ephemeral=not is_dm)
         except ValueError as e:
             logger.warning(f"Validation error in parse_command: {e}")
-            await interaction.response.send_message(
+            await safe_respond(
+                interaction,
                 f"❌ Invalid input: {str(e)}",
                 ephemeral=not self._is_dm(interaction),
             )
         except Exception as e:
             logger.error(f"Error in parse_command: {e}", exc_info=True)
-            error_msg = "❌ An error occurred while processing your transaction. Please try again."
-            if interaction.response.is_done():
-                await interaction.followup.send(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
-            else:
-                await interaction.response.send_message(
-                    error_msg, ephemeral=not self._is_dm(interaction)
-                )
+            await safe_respond(
+                interaction,
+                "❌ An error occurred while processing your transaction. "
+                "Please try again.",
+                ephemeral=not self._is_dm(interaction),
+            )
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -340,7 +611,10 @@ class ParsingCog(commands.Cog):
             # Remove the bot mention from the message if present
             content = message.content
             if is_mentioned:
-                content = content.replace(f"<@{self.bot.user.id}>", "").strip()
+                if self._mention_re is None:
+                    # Matches both plain and nickname (<@!id>) mentions
+                    self._mention_re = re.compile(rf"<@!?{self.bot.user.id}>")
+                content = self._mention_re.sub("", content).strip()
 
             if not content or not content.strip():
                 return
@@ -352,65 +626,25 @@ class ParsingCog(commands.Cog):
                 )
                 return
 
-            parsed = self.nlp_service.parse(content)
+            reply, view = await self._handle_transaction(
+                content,
+                user_id=str(message.author.id),
+                channel_id=str(message.channel.id),
+                message_id=str(message.id),
+                guild_id=str(message.guild.id) if message.guild else None,
+                is_dm=is_dm,
+            )
 
-            if not parsed.is_valid():
-                await message.reply(
-                    "❓ I couldn't parse a valid transaction from your message.\n"
-                    "Please make sure to include an amount and source/destination.\n"
-                    "Use `/help` for examples."
-                )
+            if reply is None:
+                self._queue_reply(message, INVALID_MESSAGE_REPLY)
                 logger.info(
                     f"Invalid transaction parse from user {message.author.id}: {content}"
                 )
-                return
-
-            user_id = str(message.author.id)
-            channel_id = str(message.channel.id)
-            message_id = str(message.id)
-            guild_id = str(message.guild.id) if message.guild else None
-
-            if parsed.confidence < LOW_CONFIDENCE_THRESHOLD:
-                view = TransactionView(
-                    parsed=parsed,
-                    original_message=content,
-                    repository=self.repository,
-                    user_id=user_id,
-                    channel_id=channel_id,
-                    message_id=message_id,
-                    guild_id=guild_id,
-                    is_dm=is_dm,
-                )
-                await message.reply(
-                    format_low_confidence_message(parsed),
-                    view=view,
-                )
-                logger.info(
-                    f"Low confidence parse from user {user_id}, awaiting confirmation"
-                )
+            elif view is not None:
+                # The view belongs to its own message, so it isn't coalesced
+                await message.reply(reply, view=view)
             else:
-                # High confidence - save directly
-                entry = self.repository.insert(
-                    parsed=parsed,
-                    user_id=user_id,
-                    channel_id=channel_id,
-                    message_id=message_id,
-                    guild_id=guild_id,
-                    confirmed=True,
-                )
-
-                reply_content = (
-                    f"✅ Transaction recorded (ID: `{entry.id}`):\n"
-                    f"{format_transaction(parsed)}"
-                )
-
-                # Add asset balances
-                balances = format_asset_balances(self.repository, user_id)
-                if balances:
-                    reply_content += balances
-
-                await message.reply(reply_content)
-                logger.info(f"Transaction {entry.id} recorded from user {user_id}")
+                self._queue_reply(message, reply)
         except ValueError as e:
             logger.warning(f"Validation error in on_message: {e}")
             await message.reply(f"❌ Invalid input: {str(e)}")
@@ -4,7 +4,10 @@ Recap Cog for daily financial recaps with charts.
 Handles the /recap command for generating daily summaries and burndown charts.
 """
 
+import asyncio
+import io
 import logging
+from concurrent.futures import ProcessPoolExecutor
 
 import discord
 from discord import app_commands
@@ -13,6 +16,8 @@ from discord.ext import commands
 from yuuka.db import BudgetRepository, LedgerRepository
 from yuuka.services.recap import RecapService
 
+from ..utils import render_chart
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,11 +30,14 @@ class RecapCog(commands.Cog):
         repository: LedgerRepository,
         budget_repo: BudgetRepository,
         recap_service: RecapService,
+        chart_pool: ProcessPoolExecutor,
     ):
         self.bot = bot
         self.repository = repository
         self.budget_repo = budget_repo
         self.recap_service = recap_service
+        # Owned by the bot, which shuts it down on close
+        self.chart_pool = chart_pool
 
     def _is_dm(self, interaction: discord.Interaction) -> bool:
         """Check if interaction is in a DM."""
@@ -44,9 +52,12 @@ class RecapCog(commands.Cog):
 
             await interaction.response.defer(ephemeral=not is_dm)
 
-            # Generate recap
+            # The recap and the budget are independent reads
             try:
-                recap = self.recap_service.generate_recap(user_id)
+                recap, budget = await asyncio.gather(
+                    asyncio.to_thread(self.recap_service.generate_recap, user_id),
+                    asyncio.to_thread(self.budget_repo.get_by_user, user_id),
+                )
             except Exception as e:
                 logger.error(
                     f"Error generating recap for user {user_id}: {e}", exc_info=True
@@ -70,16 +81,18 @@ class RecapCog(commands.Cog):
                 logger.debug(f"No recap data for user {user_id}")
                 return
 
-            # Get budget for chart
-            budget = self.budget_repo.get_by_user(user_id)
+            # Draw the chart and format the message concurrently, off the
+            # event loop; each failure is handled separately below
+            chart_png, message = await asyncio.gather(
+                render_chart(self.chart_pool, recap, budget),
+                asyncio.to_thread(self.recap_service.format_recap_message, recap),
+                return_exceptions=True,
+            )
 
-            # Generate chart
-            chart_buffer = None
-            try:
-                chart_buffer = self.recap_service.generate_burndown_chart(recap, budget)
-            except MemoryError:
+            if isinstance(chart_png, MemoryError):
                 logger.error(
-                    f"Memory error generating chart for user {user_id}", exc_info=True
+                    f"Memory error generating chart for user {user_id}",
+                    exc_info=chart_png,
                 )
                 await interaction.followup.send(
                     "❌ Chart generation failed due to memory constraints. "
@@ -87,9 +100,10 @@ class RecapCog(commands.Cog):
                     ephemeral=not is_dm,
                 )
                 return
-            except Exception as e:
+            if isinstance(chart_png, BaseException):
                 logger.error(
-                    f"Error generating chart for user {user_id}: {e}", exc_info=True
+                    f"Error generating chart for user {user_id}: {chart_png}",
+                    exc_info=chart_png,
                 )
                 await interaction.followup.send(
                     "❌ Error generating chart. Please try again.",
@@ -97,18 +111,19 @@ class RecapCog(commands.Cog):
                 )
                 return
 
-            # Format message
-            try:
-                message = self.recap_service.format_recap_message(recap)
-            except Exception as e:
-                logger.error(f"Error formatting recap message: {e}", exc_info=True)
+            if isinstance(message, BaseException):
+                logger.error(
+                    f"Error formatting recap message: {message}", exc_info=message
+                )
                 message = (
                     "📊 **Daily Recap**\n\nError formatting details. Please check logs."
                 )
 
             # Send with chart
             try:
-                file = discord.File(chart_buffer, filename="burndown_chart.png")
+                file = discord.File(
+                    io.BytesIO(chart_png), filename="burndown_chart.png"
+                )
                 await interaction.followup.send(content=message, file=file)
                 logger.info(f"Sent recap for user {user_id}")
             except discord.HTTPException as e:
@@ -117,10 +132,6 @@ class RecapCog(commands.Cog):
                     "❌ Error sending recap. The chart may be too large.",
                     ephemeral=not is_dm,
                 )
-            finally:
-                # Clean up buffer
-                if chart_buffer:
-                    chart_buffer.close()
         except Exception as e:
             logger.error(f"Error in recap_command: {e}", exc_info=True)
             error_msg = (
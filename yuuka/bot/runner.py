@@ -5,35 +5,51 @@ This module handles configuration loading and bot startup.
 """
 
 import logging
+import logging.handlers
 import os
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 from yuuka.config import (
+    LOG_BACKUP_COUNT,
     LOG_FILE,
     LOG_FORMAT,
+    LOG_MAX_BYTES,
     ensure_directories,
     get_log_level,
 )
 
-from .client import create_bot
+logger = logging.getLogger(__name__)
 
-# Ensure required directories exist
-ensure_directories()
+# .env at the repository root
+ENV_PATH = Path(__file__).parent.parent.parent / ".env"
 
-# Configure logging
-logging.basicConfig(
-    level=get_log_level(),
-    format=LOG_FORMAT,
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout),
-    ],
-)
 
-logger = logging.getLogger(__name__)
+def setup_logging():
+    """
+    Create the data/log directories and configure root logging.
+
+    Called from run() rather than at import time, so importing the bot
+    package doesn't open the log file. Safe to call more than once; the
+    file isn't opened until the first record is written.
+    """
+    if logging.getLogger().handlers:
+        return
+
+    ensure_directories()
+    logging.basicConfig(
+        level=get_log_level(),
+        format=LOG_FORMAT,
+        handlers=[
+            logging.handlers.RotatingFileHandler(
+                LOG_FILE,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                delay=True,
+            ),
+            logging.StreamHandler(sys.stdout),
+        ],
+    )
 
 
 def get_token() -> str:
@@ -74,21 +90,27 @@ def get_token() -> str:
 
 def run():
     """Run the Discord bot with comprehensive error handling."""
+    setup_logging()
+
     try:
         # Load .env file if it exists
-        env_path = Path(__file__).parent.parent.parent / ".env"
-        if env_path.exists():
-            load_dotenv(env_path)
-            logger.info(f"Loaded environment from {env_path}")
-            print(f"Loaded environment from {env_path}")
+        if ENV_PATH.exists():
+            from dotenv import load_dotenv
+
+            load_dotenv(ENV_PATH)
+            logger.info(f"Loaded environment from {ENV_PATH}")
+            print(f"Loaded environment from {ENV_PATH}")
         else:
-            logger.warning(f".env file not found at {env_path}")
+            logger.warning(f".env file not found at {ENV_PATH}")
 
         token = get_token()
 
         logger.info("Starting Yuuka Discord Bot...")
         print("Starting Yuuka Discord Bot...")
 
+        # Only needed once a valid token has been found
+        from .client import create_bot
+
         try:
             bot = create_bot()
         except RuntimeError as e:
@@ -5,13 +5,33 @@ Handles scheduling tasks to run at specific times using discord.ext.tasks.
 """
 
 import asyncio
+import io
 import logging
+import random
+import time as clock
+import zlib
+from collections import deque
 from datetime import time, timedelta, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import discord
 from discord.ext import tasks
 
+from yuuka.config import (
+    RECAP_RETRY_BASE_DELAY,
+    RECAP_SEND_ATTEMPTS,
+    RECAP_SEND_CONCURRENCY,
+    RECAP_SEND_MAX_CONCURRENCY,
+    RECAP_SEND_RATE,
+    RECAP_SEND_TARGET_LATENCY,
+    RECAP_USER_TIMEOUT,
+    RECAP_WINDOW_MINUTES,
+)
+from yuuka.db import BudgetConfig
+from yuuka.services.recap import RecapReport
+
+from .utils import render_chart
+
 if TYPE_CHECKING:
     from yuuka.bot.client import YuukaBot
 
@@ -23,6 +43,97 @@ UTC_PLUS_7 = timezone(timedelta(hours=7))
 # Time to send daily recap (00:00 UTC+7)
 DAILY_RECAP_TIME = time(hour=0, minute=0, second=0, tzinfo=UTC_PLUS_7)
 
+# Header added to automated recaps
+RECAP_HEADER = "🌅 **Good morning! Here's your daily financial recap:**\n\n"
+
+
+def recap_delay(user_id: str) -> float:
+    """
+    Seconds after the daily trigger at which a user's recap is sent.
+
+    Spreads the broadcast over RECAP_WINDOW_MINUTES instead of sending
+    everything at midnight. The offset comes from a stable hash of the user
+    ID, so each user gets their recap at the same time every day.
+    """
+    return zlib.crc32(user_id.encode()) % (RECAP_WINDOW_MINUTES * 60)
+
+
+class AimdLimiter:
+    """
+    Concurrency limit that adapts to how Discord is coping.
+
+    The limit grows by `increase` after each success while the recent mean
+    latency is within target, and is multiplied by `decrease` after a
+    failed send (additive increase, multiplicative decrease).
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 16,
+        increase: float = 0.5,
+        decrease: float = 0.5,
+        target_latency: float = 2.0,
+        window: int = 20,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.target_latency = target_latency
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self):
+        """Wait until a slot is free under the current limit."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+
+    async def release(self, latency: float, ok: bool):
+        """Free a slot and adjust the limit from the finished send."""
+        async with self._condition:
+            self._in_flight -= 1
+            self._latencies.append(latency)
+            if not ok:
+                self.limit = max(self.minimum, self.limit * self.decrease)
+            elif sum(self._latencies) / len(self._latencies) <= self.target_latency:
+                self.limit = min(self.maximum, self.limit + self.increase)
+            self._condition.notify_all()
+
+
+class AsyncTokenBucket:
+    """
+    Token bucket pacing requests to a steady rate, with bursts up to capacity.
+
+    Tokens refill continuously at `rate` per second; acquire() takes one,
+    waiting for the next refill when the bucket is empty.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = clock.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait for and take one token."""
+        async with self._lock:
+            while True:
+                now = clock.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
 
 class RecapScheduler:
     """Scheduler for automated daily recaps."""
@@ -36,6 +147,13 @@ class RecapScheduler:
         """
         self.bot = bot
         self._started = False
+        # DM channels by user ID, kept across daily runs; discord.py only
+        # caches the most recent private channels
+        self._dm_channels: dict[str, discord.DMChannel] = {}
+        # Paces recap DMs across all concurrent sends
+        self._send_bucket = AsyncTokenBucket(RECAP_SEND_RATE, RECAP_SEND_RATE)
+        # Recap sends in progress, by user ID
+        self._sending: dict[str, asyncio.Task[bool]] = {}
         logger.info("RecapScheduler initialized")
 
     def start(self):
@@ -61,10 +179,8 @@ class RecapScheduler:
         logger.info("Starting daily recap task...")
 
         try:
-            # Get all users who have daily recap enabled
-            users_with_config = (
-                self.bot.budget_repo.get_all_users_with_daily_recap_enabled()
-            )
+            # Get all users who have daily recap enabled, with their configs
+            users_with_config = self.bot.budget_repo.get_all_with_daily_recap_enabled()
 
             if not users_with_config:
                 logger.info("No users with daily recap enabled found")
@@ -72,24 +188,76 @@ class RecapScheduler:
 
             logger.info(f"Sending daily recap to {len(users_with_config)} users")
 
+            # Build every recap up front, in one pass over one connection
+            recaps = await asyncio.to_thread(
+                self.bot.recap_service.generate_recaps_bulk, users_with_config
+            )
+
+            # Users are handled concurrently, a bounded number at a time;
+            # discord.py already waits out rate limits on each send
+            limiter = AimdLimiter(
+                RECAP_SEND_CONCURRENCY,
+                maximum=RECAP_SEND_MAX_CONCURRENCY,
+                target_latency=RECAP_SEND_TARGET_LATENCY,
+            )
+
+            async def send(user_id: str, budget: BudgetConfig) -> bool:
+                await asyncio.sleep(recap_delay(user_id))
+                await limiter.acquire()
+                started = clock.monotonic()
+                ok = False
+                try:
+                    # Bounded so one stuck user can't hold up the run
+                    ok = await asyncio.wait_for(
+                        self._send_recap_once(user_id, budget, recaps.get(user_id)),
+                        timeout=RECAP_USER_TIMEOUT,
+                    )
+                finally:
+                    await limiter.release(clock.monotonic() - started, ok)
+                return ok
+
+            tasks = {
+                asyncio.create_task(send(user_id, budget)): user_id
+                for user_id, budget in users_with_config.items()
+            }
+
             success_count = 0
             error_count = 0
+            timeout_count = 0
 
-            for user_id in users_with_config:
-                try:
-                    await self._send_recap_to_user(user_id)
-                    success_count += 1
-                    # Small delay to avoid rate limiting
-                    await asyncio.sleep(1)
-                except Exception as e:
-                    error_count += 1
-                    logger.error(
-                        f"Failed to send recap to user {user_id}: {e}", exc_info=True
+            # Tally each user as soon as they finish
+            pending = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
                     )
+                    for task in done:
+                        user_id = tasks[task]
+                        error = task.exception()
+                        if error is None and task.result():
+                            success_count += 1
+                        elif error is None:
+                            # Discord rejected the DM; already logged
+                            error_count += 1
+                        elif isinstance(error, asyncio.TimeoutError):
+                            timeout_count += 1
+                            logger.warning(f"Recap to user {user_id} timed out")
+                        else:
+                            error_count += 1
+                            logger.error(
+                                f"Failed to send recap to user {user_id}: {error}",
+                                exc_info=error,
+                            )
+            except asyncio.CancelledError:
+                for task in pending:
+                    task.cancel()
+                raise
 
             logger.info(
                 f"Daily recap task completed. "
-                f"Success: {success_count}, Errors: {error_count}"
+                f"Success: {success_count}, Errors: {error_count}, "
+                f"Timeouts: {timeout_count}"
             )
 
         except Exception as e:
@@ -106,44 +274,92 @@ class RecapScheduler:
         """Handle errors in the daily recap task."""
         logger.error(f"Error in daily_recap_task: {error}", exc_info=True)
 
-    async def _send_recap_to_user(self, user_id: str):
+    async def _send_recap_once(
+        self,
+        user_id: str,
+        budget: Optional[BudgetConfig] = None,
+        recap: Optional[RecapReport] = None,
+    ) -> bool:
+        """
+        Send a recap to a user unless one is already being sent to them.
+
+        A request that arrives while the user's recap is in flight (e.g. a
+        manual recap during the daily run) waits for that send and shares
+        its result instead of sending a duplicate DM.
+
+        Args:
+            user_id: Discord user ID
+            budget: The user's budget config if already loaded
+            recap: The user's recap if already generated
+
+        Returns:
+            The result of _send_recap_to_user
+        """
+        pending = self._sending.get(user_id)
+        if pending is not None:
+            # Shielded so a cancelled joiner doesn't cancel the original send
+            return await asyncio.shield(pending)
+
+        task = asyncio.create_task(self._send_recap_to_user(user_id, budget, recap))
+        self._sending[user_id] = task
+        try:
+            return await task
+        finally:
+            del self._sending[user_id]
+
+    async def _send_recap_to_user(
+        self,
+        user_id: str,
+        budget: Optional[BudgetConfig] = None,
+        recap: Optional[RecapReport] = None,
+    ) -> bool:
         """
         Send a daily recap to a specific user via DM.
 
         Args:
             user_id: Discord user ID
+            budget: The user's budget config if already loaded
+            recap: The user's recap if already generated
+
+        Returns:
+            False if Discord rejected the send with an API error, True
+            otherwise (including users skipped for having no data)
         """
         try:
-            # Get the Discord user
-            user = await self.bot.fetch_user(int(user_id))
+            # Get the Discord user, from the cache when possible
+            discord_id = int(user_id)
+            user = self.bot.get_user(discord_id)
+            if user is None:
+                user = await self.bot.fetch_user(discord_id)
 
             if not user:
                 logger.warning(f"Could not find Discord user {user_id}")
-                return
+                return True
 
             # Don't send to bots
             if user.bot:
-                return
+                return True
+
+            # Get budget for the forecast and chart
+            if budget is None:
+                budget = self.bot.budget_repo.get_by_user(user_id)
 
             # Generate recap
-            recap = self.bot.recap_service.generate_recap(user_id)
+            if recap is None:
+                recap = self.bot.recap_service.generate_recap(user_id, budget=budget)
 
             # Check if there's any data
             if (
                 recap.current_balance == 0
                 and recap.today_summary.transaction_count == 0
             ):
-                logger.debug(f"No recap data for user {user_id}, skipping")
-                return
-
-            # Get budget for chart
-            budget = self.bot.budget_repo.get_by_user(user_id)
+                logger.debug("No recap data for user %s, skipping", user_id)
+                return True
 
-            # Generate chart
+            # Generate chart in the bot's chart worker processes
             try:
-                chart_buffer = self.bot.recap_service.generate_burndown_chart(
-                    recap, budget
-                )
+                chart_png = await render_chart(self.bot.chart_pool, recap, budget)
+                chart_buffer = io.BytesIO(chart_png)
             except Exception as e:
                 logger.error(f"Failed to generate chart for user {user_id}: {e}")
                 chart_buffer = None
@@ -152,22 +368,17 @@ class RecapScheduler:
             message = self.bot.recap_service.format_recap_message(recap)
 
             # Add header for automated recap
-            message = (
-                "🌅 **Good morning! Here's your daily financial recap:**\n\n" + message
-            )
+            message = RECAP_HEADER + message
 
             # Send via DM
             try:
-                dm_channel = await user.create_dm()
+                dm_channel = self._dm_channels.get(user_id)
+                if dm_channel is None:
+                    dm_channel = await user.create_dm()
+                    self._dm_channels[user_id] = dm_channel
 
-                if chart_buffer:
-                    file = discord.File(chart_buffer, filename="daily_recap.png")
-                    await dm_channel.send(content=message, file=file)
-                    chart_buffer.close()
-                else:
-                    await dm_channel.send(content=message)
-
-                logger.info(f"Sent daily recap to user {user_id}")
+                await self._send_dm(dm_channel, message, chart_buffer)
+                logger.info("Sent daily recap to user %s", user_id)
 
             except discord.Forbidden:
                 logger.warning(
@@ -175,11 +386,53 @@ class RecapScheduler:
                 )
             except discord.HTTPException as e:
                 logger.error(f"Discord API error sending recap to {user_id}: {e}")
+                return False
+
+            return True
 
         except Exception as e:
             logger.error(f"Error sending recap to user {user_id}: {e}", exc_info=True)
             raise
 
+    async def _send_dm(
+        self,
+        dm_channel: discord.DMChannel,
+        message: str,
+        chart_buffer: Optional[io.BytesIO],
+    ):
+        """
+        Send a recap DM, retrying server errors with jittered backoff.
+
+        discord.py already waits out rate limits and retries a few server
+        errors itself; this gives a recap a few more chances before it is
+        lost for the day. Other HTTP errors are raised immediately.
+
+        Args:
+            dm_channel: The user's DM channel
+            message: Recap message content
+            chart_buffer: PNG chart to attach, if one was rendered
+        """
+        for attempt in range(RECAP_SEND_ATTEMPTS):
+            await self._send_bucket.acquire()
+            try:
+                if chart_buffer:
+                    chart_buffer.seek(0)
+                    file = discord.File(chart_buffer, filename="daily_recap.png")
+                    await dm_channel.send(content=message, file=file)
+                else:
+                    await dm_channel.send(content=message)
+                return
+            except discord.HTTPException as e:
+                if e.status < 500 or attempt == RECAP_SEND_ATTEMPTS - 1:
+                    raise
+                delay = RECAP_RETRY_BASE_DELAY * 2**attempt
+                delay += random.uniform(0, RECAP_RETRY_BASE_DELAY)
+                logger.warning(
+                    f"Discord server error sending recap ({e.status}), "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
     async def send_manual_recap(self, user_id: str) -> bool:
         """
         Manually trigger a recap send to a user (for testing).
@@ -191,8 +444,7 @@ class RecapScheduler:
             True if successful, False otherwise
         """
         try:
-            await self._send_recap_to_user(user_id)
-            return True
+            return await self._send_recap_once(user_id)
         except Exception as e:
             logger.error(f"Manual recap failed for user {user_id}: {e}")
             return False
@@ -0,0 +1,7 @@
+from .charts import render_chart
+from .response import safe_respond
+
+__all__ = [
+    "render_chart",
+    "safe_respond",
+]
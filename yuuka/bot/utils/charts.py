@@ -0,0 +1,60 @@
+"""
+Chart rendering helpers shared by the recap command and the scheduler.
+
+Renders burndown charts in the bot's chart worker processes and keeps the
+most recent PNGs, so an unchanged recap isn't drawn again.
+"""
+
+import asyncio
+import hashlib
+import pickle
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Optional
+
+from yuuka.db import BudgetConfig
+from yuuka.services.recap import RecapReport, render_burndown_chart
+
+# Number of rendered charts kept, keyed by a digest of their input
+CHART_CACHE_SIZE = 64
+
+_chart_cache: OrderedDict[bytes, bytes] = OrderedDict()
+
+
+def _chart_key(recap: RecapReport, budget: Optional[BudgetConfig]) -> bytes:
+    """Digest of everything the chart is drawn from."""
+    return hashlib.blake2b(pickle.dumps((recap, budget)), digest_size=16).digest()
+
+
+async def render_chart(
+    pool: Executor,
+    recap: RecapReport,
+    budget: Optional[BudgetConfig] = None,
+) -> bytes:
+    """
+    Render a recap's burndown chart, reusing the PNG if it was just drawn.
+
+    The recap includes its report date, so cached charts never outlive
+    the day they were drawn for.
+
+    Args:
+        pool: Executor the chart is drawn in
+        recap: The recap report data
+        budget: Optional budget config for forecast line
+
+    Returns:
+        The PNG image bytes
+    """
+    key = _chart_key(recap, budget)
+    png = _chart_cache.get(key)
+    if png is not None:
+        _chart_cache.move_to_end(key)
+        return png
+
+    loop = asyncio.get_running_loop()
+    png = await loop.run_in_executor(pool, render_burndown_chart, recap, budget)
+
+    _chart_cache[key] = png
+    if len(_chart_cache) > CHART_CACHE_SIZE:
+        _chart_cache.popitem(last=False)
+    return png
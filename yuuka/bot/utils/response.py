@@ -0,0 +1,31 @@
+"""
+Interaction response helpers shared by the bot cogs.
+
+Centralizes the choice between the initial interaction response and a
+followup message so commands don't repeat the same branching.
+"""
+
+import discord
+
+
+async def safe_respond(
+    interaction: discord.Interaction,
+    content: str,
+    *,
+    ephemeral: bool = True,
+) -> None:
+    """
+    Send a message for an interaction, whether or not it was already answered.
+
+    Uses the followup webhook once the interaction has been responded to or
+    deferred, and the initial response otherwise.
+
+    Args:
+        interaction: The Discord interaction to respond to
+        content: Message content to send
+        ephemeral: Whether the message should only be visible to the user
+    """
+    if interaction.response.is_done():
+        await interaction.followup.send(content, ephemeral=ephemeral)
+    else:
+        await interaction.response.send_message(content, ephemeral=ephemeral)
@@ -37,12 +37,24 @@ DEFAULT_WARNING_THRESHOLD = 0.2
 DISCORD_MESSAGE_MAX_LENGTH = 2000
 CONFIRMATION_TIMEOUT = 60.0  # seconds
 
+# Daily recap scheduler
+RECAP_SEND_CONCURRENCY = 8  # users processed at once, initially
+RECAP_SEND_MAX_CONCURRENCY = 16
+RECAP_SEND_TARGET_LATENCY = 2.0  # seconds per user before concurrency stops growing
+RECAP_SEND_RATE = 45  # DMs per second, under Discord's global 50 requests/s
+RECAP_SEND_ATTEMPTS = 3  # tries per DM when Discord returns a server error
+RECAP_RETRY_BASE_DELAY = 0.5  # seconds, doubled on each retry
+RECAP_USER_TIMEOUT = 60.0  # seconds allowed for one user's recap
+RECAP_WINDOW_MINUTES = 15  # recaps are spread over this long after midnight
+
 # Export configuration
 MAX_EXPORT_ENTRIES = 10000
 EXPORT_FORMATS = ["xlsx", "csv"]
 
 # Chart generation
-CHART_DPI = 150
+CHART_DPI = 72
+CHART_PALETTE_COLORS = 64
+CHART_PROCESS_WORKERS = min(4, os.cpu_count() or 1)  # chart worker processes
 CHART_FORMAT = "png"
 CHART_WIDTH = 12
 CHART_HEIGHT = 8
@@ -51,6 +63,8 @@ CHART_HEIGHT = 8
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_FILE = "yuuka_bot.log"
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_MAX_BYTES = 10_000_000
+LOG_BACKUP_COUNT = 3
 
 # Rate limiting (future enhancement)
 MAX_COMMANDS_PER_MINUTE = 30
@@ -8,6 +8,8 @@ Handles all account-related database operations including:
 """
 
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import Optional
 
@@ -18,6 +20,15 @@ from .models import Account, AccountAlias, AccountGroup
 
 logger = logging.getLogger(__name__)
 
+# Number of resolved aliases kept, keyed by (user_id, alias)
+ALIAS_CACHE_SIZE = 4096
+
+# Number of account groups kept, keyed by (user_id, group_id)
+GROUP_CACHE_SIZE = 1024
+
+# Marks a cache miss, since None is a cached "no such alias" result
+_MISSING = object()
+
 
 class AccountRepository(BaseRepository):
     """
@@ -37,6 +48,50 @@ class AccountRepository(BaseRepository):
                         as main repository handles this)
         """
         super().__init__(db_path, init_schema=init_schema)
+        # Alias lookups made while parsing, as group ids; only this repository
+        # writes aliases, so entries are dropped once a change to one commits.
+        # Groups themselves are never updated, so they're kept as is.
+        self._alias_cache: OrderedDict[tuple[str, str], Optional[int]] = OrderedDict()
+        self._group_cache: OrderedDict[tuple[str, int], AccountGroup] = OrderedDict()
+        self._alias_cache_lock = threading.Lock()
+        # Bumped on every invalidation, so a lookup that raced a change
+        # doesn't store what it read from before the change
+        self._alias_generation = 0
+
+    def _invalidate_alias(self, alias: str, user_id: str):
+        """Drop a cached alias lookup once the alias change commits."""
+
+        def invalidate():
+            with self._alias_cache_lock:
+                self._alias_generation += 1
+                self._alias_cache.pop((user_id, alias), None)
+
+        self._after_commit(invalidate)
+
+    def _cache_alias(
+        self, key: tuple[str, str], group_id: Optional[int], generation: int
+    ):
+        """Remember an alias lookup, evicting the least recently used."""
+        with self._alias_cache_lock:
+            if generation != self._alias_generation:
+                return
+            self._alias_cache[key] = group_id
+            if len(self._alias_cache) > ALIAS_CACHE_SIZE:
+                self._alias_cache.popitem(last=False)
+
+    def _cache_group(self, group: AccountGroup):
+        """Remember a loaded account group, evicting the least recently used."""
+        with self._alias_cache_lock:
+            self._group_cache[(group.user_id, group.id)] = group
+            if len(self._group_cache) > GROUP_CACHE_SIZE:
+                self._group_cache.popitem(last=False)
+
+    def clear_alias_cache(self):
+        """Drop all cached alias lookups and account groups."""
+        with self._alias_cache_lock:
+            self._alias_generation += 1
+            self._alias_cache.clear()
+            self._group_cache.clear()
 
     # =========================================================================
     # Account Groups
@@ -72,27 +127,25 @@ class AccountRepository(BaseRepository):
             raise ValueError("User ID cannot be empty")
 
         name = name.strip()
+        alias = name.lower()
         created_at = datetime.now(timezone.utc)
 
+        created = created_at.isoformat()
+
         try:
             with self._get_connection() as conn:
-                # Check if group already exists
-                cursor = conn.execute(
-                    """
-                    SELECT id FROM account_groups
-                    WHERE LOWER(name) = LOWER(?) AND user_id = ?
-                    """,
-                    (name, user_id),
-                )
-                if cursor.fetchone():
-                    raise ValueError(f"Account group '{name}' already exists")
-
-                # Create the group
+                # Create the group unless one with the same name (in any case)
+                # exists; a single statement, so there's no check-then-insert race
                 cursor = conn.execute(
                     """
                     INSERT INTO account_groups
                     (name, account_type, user_id, description, is_system, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    SELECT ?, ?, ?, ?, ?, ?
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM account_groups
+                        WHERE user_id = ? AND LOWER(name) = LOWER(?)
+                    )
+                    RETURNING id
                     """,
                     (
                         name,
@@ -100,10 +153,15 @@ class AccountRepository(BaseRepository):
                         user_id,
                         description,
                         1 if is_system else 0,
-                        created_at.isoformat(),
+                        created,
+                        user_id,
+                        name,
                     ),
                 )
-                group_id = cursor.lastrowid
+                row = cursor.fetchone()
+                if row is None:
+                    raise ValueError(f"Account group '{name}' already exists")
+                group_id = row[0]
 
                 # Auto-create an alias with the canonical name (lowercase)
                 conn.execute(
@@ -111,8 +169,9 @@ class AccountRepository(BaseRepository):
                     INSERT INTO account_aliases (alias, group_id, user_id, created_at)
                     VALUES (?, ?, ?, ?)
                     """,
-                    (name.lower(), group_id, user_id, created_at.isoformat()),
+                    (alias, group_id, user_id, created),
                 )
+                self._invalidate_alias(alias, user_id)
 
                 logger.info(
                     f"Created account group '{name}' (type: {account_type.value}) "
@@ -156,15 +215,7 @@ class AccountRepository(BaseRepository):
                 if not row:
                     return None
 
-                return AccountGroup(
-                    id=row[0],
-                    name=row[1],
-                    account_type=AccountType(row[2]),
-                    user_id=row[3],
-                    description=row[4],
-                    is_system=bool(row[5]),
-                    created_at=datetime.fromisoformat(row[6]) if row[6] else None,
-                )
+                return AccountGroup.from_row(row)
         except ValueError:
             raise
         except Exception as e:
@@ -185,23 +236,15 @@ class AccountRepository(BaseRepository):
                     SELECT id, name, account_type, user_id, description,
                            is_system, created_at
                     FROM account_groups
-                    WHERE LOWER(name) = LOWER(?) AND user_id = ?
+                    WHERE user_id = ? AND LOWER(name) = LOWER(?)
                     """,
-                    (name.strip(), user_id),
+                    (user_id, name.strip()),
                 )
                 row = cursor.fetchone()
                 if not row:
                     return None
 
-                return AccountGroup(
-                    id=row[0],
-                    name=row[1],
-                    account_type=AccountType(row[2]),
-                    user_id=row[3],
-                    description=row[4],
-                    is_system=bool(row[5]),
-                    created_at=datetime.fromisoformat(row[6]) if row[6] else None,
-                )
+                return AccountGroup.from_row(row)
         except Exception as e:
             logger.error(f"Error getting account group by name: {e}", exc_info=True)
             raise
@@ -224,18 +267,7 @@ class AccountRepository(BaseRepository):
                     (user_id,),
                 )
 
-                return [
-                    AccountGroup(
-                        id=row[0],
-                        name=row[1],
-                        account_type=AccountType(row[2]),
-                        user_id=row[3],
-                        description=row[4],
-                        is_system=bool(row[5]),
-                        created_at=datetime.fromisoformat(row[6]) if row[6] else None,
-                    )
-                    for row in cursor.fetchall()
-                ]
+                return [AccountGroup.from_row(row) for row in cursor.fetchall()]
         except ValueError:
             raise
         except Exception as e:
@@ -276,48 +308,45 @@ class AccountRepository(BaseRepository):
 
         try:
             with self._get_connection() as conn:
-                # Verify the group exists and belongs to user
+                # Insert only if the group belongs to the user and the alias
+                # is free; a single statement covers the common case
                 cursor = conn.execute(
                     """
-                    SELECT id FROM account_groups
+                    INSERT INTO account_aliases (alias, group_id, user_id, created_at)
+                    SELECT ?, id, user_id, ?
+                    FROM account_groups
                     WHERE id = ? AND user_id = ?
+                    ON CONFLICT(alias, user_id) DO NOTHING
+                    RETURNING id
                     """,
-                    (group_id, user_id),
+                    (alias, created_at.isoformat(), group_id, user_id),
                 )
-                if not cursor.fetchone():
-                    raise ValueError(f"Account group {group_id} not found")
-
-                # Check if alias already exists
-                cursor = conn.execute(
-                    """
-                    SELECT id, group_id FROM account_aliases
-                    WHERE alias = ? AND user_id = ?
-                    """,
-                    (alias, user_id),
-                )
-                existing = cursor.fetchone()
-                if existing:
-                    if existing[1] == group_id:
-                        # Already mapped to this group, return existing
-                        return AccountAlias(
-                            id=existing[0],
-                            alias=alias,
-                            group_id=group_id,
-                            user_id=user_id,
-                        )
-                    else:
+                row = cursor.fetchone()
+                if row is None:
+                    # Either the alias is taken or the group isn't the user's
+                    cursor = conn.execute(
+                        """
+                        SELECT id, group_id FROM account_aliases
+                        WHERE alias = ? AND user_id = ?
+                        """,
+                        (alias, user_id),
+                    )
+                    existing = cursor.fetchone()
+                    if not existing:
+                        raise ValueError(f"Account group {group_id} not found")
+                    if existing[1] != group_id:
                         raise ValueError(
                             f"Alias '{alias}' is already mapped to another account"
                         )
+                    # Already mapped to this group, return existing
+                    return AccountAlias(
+                        id=existing[0],
+                        alias=alias,
+                        group_id=group_id,
+                        user_id=user_id,
+                    )
 
-                # Create the alias
-                cursor = conn.execute(
-                    """
-                    INSERT INTO account_aliases (alias, group_id, user_id, created_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (alias, group_id, user_id, created_at.isoformat()),
-                )
+                self._invalidate_alias(alias, user_id)
 
                 logger.info(
                     f"Added alias '{alias}' to account group {group_id} "
@@ -325,7 +354,7 @@ class AccountRepository(BaseRepository):
                 )
 
                 return AccountAlias(
-                    id=cursor.lastrowid,
+                    id=row[0],
                     alias=alias,
                     group_id=group_id,
                     user_id=user_id,
@@ -351,16 +380,7 @@ class AccountRepository(BaseRepository):
                     (group_id, user_id),
                 )
 
-                return [
-                    AccountAlias(
-                        id=row[0],
-                        alias=row[1],
-                        group_id=row[2],
-                        user_id=row[3],
-                        created_at=datetime.fromisoformat(row[4]) if row[4] else None,
-                    )
-                    for row in cursor.fetchall()
-                ]
+                return [AccountAlias.from_row(row) for row in cursor.fetchall()]
         except Exception as e:
             logger.error(f"Error getting aliases for group: {e}", exc_info=True)
             raise
@@ -371,6 +391,7 @@ class AccountRepository(BaseRepository):
 
         This is the main lookup method used when processing transactions.
         If the alias is found, returns the associated AccountGroup.
+        Results are cached until the alias is added or removed.
 
         Args:
             alias: The input account name (will be normalized)
@@ -379,40 +400,78 @@ class AccountRepository(BaseRepository):
         Returns:
             AccountGroup if alias is found, None otherwise
         """
+        group_id = self.resolve_account_group_id(alias, user_id)
+        if group_id is None:
+            return None
+
+        # Uncommitted groups may still be rolled back, so they aren't cached
+        if self._in_write_transaction():
+            return self.get_account_group_by_id(group_id, user_id)
+
+        key = (user_id, group_id)
+        with self._alias_cache_lock:
+            group = self._group_cache.get(key)
+            if group is not None:
+                self._group_cache.move_to_end(key)
+                return group
+
+        group = self.get_account_group_by_id(group_id, user_id)
+        if group:
+            self._cache_group(group)
+        return group
+
+    def resolve_account_group_id(self, alias: str, user_id: str) -> Optional[int]:
+        """
+        Resolve an alias to its account group's ID, without loading the group.
+
+        The lookup is answered from the covering alias index alone; the
+        planner would otherwise pick the UNIQUE(alias, user_id) index and
+        read the row for group_id.
+
+        Args:
+            alias: The input account name (will be normalized)
+            user_id: Discord user ID
+
+        Returns:
+            The group ID if alias is found, None otherwise
+        """
         if not alias:
             return None
 
         alias = alias.strip().lower()
+        key = (user_id, alias)
+
+        # Inside a transaction that has written, the cache may not reflect
+        # this thread's own changes, and what's read may still be rolled back
+        in_write = self._in_write_transaction()
+
+        with self._alias_cache_lock:
+            generation = self._alias_generation
+            cached = _MISSING if in_write else self._alias_cache.get(key, _MISSING)
+            if cached is not _MISSING:
+                self._alias_cache.move_to_end(key)
+                return cached
 
         try:
             with self._get_connection() as conn:
                 cursor = conn.execute(
                     """
-                    SELECT g.id, g.name, g.account_type, g.user_id,
-                           g.description, g.is_system, g.created_at
-                    FROM account_groups g
-                    JOIN account_aliases a ON g.id = a.group_id
-                    WHERE a.alias = ? AND a.user_id = ?
+                    SELECT group_id
+                    FROM account_aliases INDEXED BY idx_account_aliases_cover
+                    WHERE alias = ? AND user_id = ?
                     """,
                     (alias, user_id),
                 )
                 row = cursor.fetchone()
-                if not row:
-                    return None
-
-                return AccountGroup(
-                    id=row[0],
-                    name=row[1],
-                    account_type=AccountType(row[2]),
-                    user_id=row[3],
-                    description=row[4],
-                    is_system=bool(row[5]),
-                    created_at=datetime.fromisoformat(row[6]) if row[6] else None,
-                )
+                group_id = row[0] if row else None
         except Exception as e:
             logger.error(f"Error resolving account alias: {e}", exc_info=True)
             raise
 
+        if not in_write:
+            self._cache_alias(key, group_id, generation)
+        return group_id
+
     def remove_account_alias(self, alias: str, user_id: str) -> bool:
         """
         Remove an alias.
@@ -440,6 +499,7 @@ class AccountRepository(BaseRepository):
                 )
                 deleted = cursor.rowcount > 0
                 if deleted:
+                    self._invalidate_alias(alias, user_id)
                     logger.info(f"Removed alias '{alias}' for user {user_id}")
                 return deleted
         except Exception as e:
@@ -457,14 +517,15 @@ class AccountRepository(BaseRepository):
         Returns:
             True if the name has no alias mapping
         """
-        return self.resolve_account_alias(name, user_id) is None
+        return self.resolve_account_group_id(name, user_id) is None
 
     def get_pending_account_names(self, user_id: str) -> list[str]:
         """
         Get account names that are used but not mapped to any group.
 
         This finds names in the legacy accounts table that don't have
-        a corresponding alias mapping.
+        a corresponding alias mapping. Both sides are stored lowercase, so
+        the alias index is probed directly.
 
         Args:
             user_id: Discord user ID
@@ -478,9 +539,11 @@ class AccountRepository(BaseRepository):
                     """
                     SELECT DISTINCT a.name
                     FROM accounts a
-                    LEFT JOIN account_aliases al
-                        ON LOWER(a.name) = al.alias AND a.user_id = al.user_id
-                    WHERE a.user_id = ? AND al.id IS NULL
+                    WHERE a.user_id = ?
+                      AND NOT EXISTS (
+                          SELECT 1 FROM account_aliases al
+                          WHERE al.alias = a.name AND al.user_id = a.user_id
+                      )
                     ORDER BY a.name
                     """,
                     (user_id,),
@@ -506,19 +569,34 @@ class AccountRepository(BaseRepository):
         """
         from yuuka.models.account import DEFAULT_SYSTEM_ACCOUNTS
 
-        groups = {}
-        for name, account_type, description in DEFAULT_SYSTEM_ACCOUNTS:
-            # Check if group exists
-            group = self.get_account_group_by_name(name, user_id)
-            if not group:
-                group = self.create_account_group(
-                    name=name,
-                    user_id=user_id,
-                    account_type=account_type,
-                    description=description,
-                    is_system=True,
-                )
-            groups[name.lower()] = group
+        names = [name.lower() for name, _, _ in DEFAULT_SYSTEM_ACCOUNTS]
+        placeholders = ", ".join("?" * len(names))
+
+        # One connection for the lookup and any inserts, so this commits once
+        with self._get_connection() as conn:
+            # Fetch the existing system groups in one query
+            cursor = conn.execute(
+                f"""
+                SELECT id, name, account_type, user_id, description,
+                       is_system, created_at
+                FROM account_groups
+                WHERE user_id = ? AND LOWER(name) IN ({placeholders})
+                """,
+                (user_id, *names),
+            )
+            groups = {row[1].lower(): AccountGroup.from_row(row) for row in cursor}
+
+            for key, (name, account_type, description) in zip(
+                names, DEFAULT_SYSTEM_ACCOUNTS
+            ):
+                if key not in groups:
+                    groups[key] = self.create_account_group(
+                        name=name,
+                        user_id=user_id,
+                        account_type=account_type,
+                        description=description,
+                        is_system=True,
+                    )
         return groups
 
     # =========================================================================
@@ -575,15 +653,7 @@ class AccountRepository(BaseRepository):
                 row = cursor.fetchone()
 
                 if row:
-                    return Account(
-                        id=row[0],
-                        name=row[1],
-                        account_type=AccountType(row[2]),
-                        user_id=row[3],
-                        description=row[4],
-                        is_system=bool(row[5]),
-                        group_id=row[6],
-                    )
+                    return Account.from_row(row)
 
                 # Create new account
                 cursor = conn.execute(
@@ -635,21 +705,40 @@ class AccountRepository(BaseRepository):
         """
         from yuuka.models.account import DEFAULT_SYSTEM_ACCOUNTS
 
-        # First ensure system account groups exist
-        groups = self.ensure_system_account_groups(user_id)
-
-        accounts = {}
-        for name, account_type, description in DEFAULT_SYSTEM_ACCOUNTS:
-            group = groups.get(name.lower())
-            account = self.get_or_create_account(
-                name=name.lower(),
-                user_id=user_id,
-                account_type=account_type,
-                description=description,
-                is_system=True,
-                group_id=group.id if group else None,
+        names = [name.lower() for name, _, _ in DEFAULT_SYSTEM_ACCOUNTS]
+        placeholders = ", ".join("?" * len(names))
+
+        # One connection for both lookups and any inserts, so this commits once
+        with self._get_connection() as conn:
+            # First ensure system account groups exist
+            groups = self.ensure_system_account_groups(user_id)
+
+            # Fetch the existing system accounts in one query
+            cursor = conn.execute(
+                f"""
+                SELECT id, name, account_type, user_id, description,
+                       is_system, group_id
+                FROM accounts
+                WHERE user_id = ? AND name IN ({placeholders})
+                """,
+                (user_id, *names),
             )
-            accounts[name.lower()] = account
+            accounts = {row[1]: Account.from_row(row) for row in cursor}
+
+            for key, (_, account_type, description) in zip(
+                names, DEFAULT_SYSTEM_ACCOUNTS
+            ):
+                if key in accounts:
+                    continue
+                group = groups.get(key)
+                accounts[key] = self.get_or_create_account(
+                    name=key,
+                    user_id=user_id,
+                    account_type=account_type,
+                    description=description,
+                    is_system=True,
+                    group_id=group.id if group else None,
+                )
         return accounts
 
     def get_user_accounts(self, user_id: str) -> list[Account]:
@@ -678,18 +767,7 @@ class AccountRepository(BaseRepository):
                     (user_id,),
                 )
 
-                return [
-                    Account(
-                        id=row[0],
-                        name=row[1],
-                        account_type=AccountType(row[2]),
-                        user_id=row[3],
-                        description=row[4],
-                        is_system=bool(row[5]),
-                        group_id=row[6],
-                    )
-                    for row in cursor.fetchall()
-                ]
+                return [Account.from_row(row) for row in cursor.fetchall()]
         except ValueError:
             raise
         except Exception as e:
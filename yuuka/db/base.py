@@ -6,6 +6,7 @@ Provides the foundation for all database operations in the Yuuka ledger system.
 
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
@@ -15,6 +16,22 @@ logger = logging.getLogger(__name__)
 # Default database path
 DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "yuuka.db"
 
+# Connections with an open unit of work, per thread and database path
+_active = threading.local()
+
+# Connections kept open between calls, per thread and database path
+_pool = threading.local()
+
+# Applied once when a pooled connection is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",  # safe with WAL; fsyncs at checkpoints only
+    "PRAGMA cache_size = -16384",  # 16 MiB page cache per connection
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 MiB
+)
+
 
 class BaseRepository:
     """
@@ -48,28 +65,108 @@ class BaseRepository:
 
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections with proper error handling."""
+        """
+        Context manager for database connections with proper error handling.
+
+        Each thread keeps one connection per database open between calls, so
+        its page and statement caches stay warm. Nested use on the same
+        thread and database (e.g. account lookups made while inserting a
+        transaction, from any repository) joins the outermost context, so
+        the whole operation commits once.
+        """
+        connections = getattr(_active, "connections", None)
+        if connections is None:
+            connections = _active.connections = {}
+            _active.commit_hooks = {}
+
+        key = str(self.db_path)
+        if key in connections:
+            # The outermost context commits or rolls back
+            yield connections[key]
+            return
+
+        callbacks = []
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path, timeout=10.0)
-            conn.row_factory = sqlite3.Row
-            # Enable foreign keys
-            conn.execute("PRAGMA foreign_keys = ON")
+            conn = self._pooled_connection(key)
+            connections[key] = conn
+            _active.commit_hooks[key] = callbacks
             yield conn
             conn.commit()
         except sqlite3.OperationalError as e:
             logger.error(f"Database locked or operational error: {e}", exc_info=True)
             if conn:
-                conn.rollback()
+                self._rollback(key, conn)
             raise
         except Exception as e:
             logger.error(f"Database error: {e}", exc_info=True)
             if conn:
-                conn.rollback()
+                self._rollback(key, conn)
             raise
         finally:
-            if conn:
+            connections.pop(key, None)
+            _active.commit_hooks.pop(key, None)
+
+        # Only reached once the commit succeeded; a rollback drops them
+        for callback in callbacks:
+            callback()
+
+    def _after_commit(self, callback):
+        """
+        Run callback once the current unit of work commits.
+
+        Used to refresh in-process caches only after other threads can see
+        the change. Outside a unit of work it runs immediately.
+        """
+        hooks = getattr(_active, "commit_hooks", {}).get(str(self.db_path))
+        if hooks is None:
+            callback()
+        else:
+            hooks.append(callback)
+
+    def _in_write_transaction(self) -> bool:
+        """Whether this thread has uncommitted writes open on the database."""
+        conn = getattr(_active, "connections", {}).get(str(self.db_path))
+        return conn is not None and conn.in_transaction
+
+    def _pooled_connection(self, key: str) -> sqlite3.Connection:
+        """Get this thread's open connection to the database, opening it once."""
+        pooled = getattr(_pool, "connections", None)
+        if pooled is None:
+            pooled = _pool.connections = {}
+
+        conn = pooled.get(key)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10.0)
+            conn.row_factory = sqlite3.Row
+            try:
+                for pragma in _CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
+            except sqlite3.Error:
                 conn.close()
+                raise
+            pooled[key] = conn
+        return conn
+
+    @staticmethod
+    def _rollback(key: str, conn: sqlite3.Connection):
+        """Roll back a pooled connection, discarding it if that fails."""
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            _pool.connections.pop(key, None)
+            conn.close()
+
+    @contextmanager
+    def session(self):
+        """
+        Keep one connection open across several repository calls.
+
+        Calls made inside the block on the same thread reuse it rather than
+        opening their own, and it commits once when the block exits.
+        """
+        with self._get_connection() as conn:
+            yield conn
 
     def _init_schema(self):
         """Initialize the database schema for double-entry bookkeeping."""
@@ -94,7 +191,7 @@ class BaseRepository:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS account_aliases (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    alias TEXT NOT NULL,
+                    alias TEXT NOT NULL CHECK(alias = lower(trim(alias))),
                     group_id INTEGER NOT NULL REFERENCES account_groups(id) ON DELETE CASCADE,
                     user_id TEXT NOT NULL CHECK(length(user_id) > 0),
                     created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
@@ -106,7 +203,7 @@ class BaseRepository:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS accounts (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
+                    name TEXT NOT NULL CHECK(name = lower(trim(name))),
                     account_type TEXT NOT NULL CHECK(
                         account_type IN ('asset', 'liability', 'equity', 'revenue', 'expense')
                     ),
@@ -171,6 +268,56 @@ class BaseRepository:
                 )
             """)
 
+            # Per-account running totals, maintained alongside journal_entries
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS account_balances (
+                    user_id TEXT NOT NULL CHECK(length(user_id) > 0),
+                    account_name TEXT NOT NULL,
+                    debit_sum REAL NOT NULL DEFAULT 0,
+                    credit_sum REAL NOT NULL DEFAULT 0,
+                    last_used TEXT,
+                    PRIMARY KEY (user_id, account_name)
+                )
+            """)
+
+            # Backfill totals for databases created before the table existed
+            conn.execute("""
+                INSERT INTO account_balances
+                    (user_id, account_name, debit_sum, credit_sum, last_used)
+                SELECT
+                    t.user_id,
+                    je.account_name,
+                    SUM(CASE WHEN je.entry_type = 'debit' THEN je.amount ELSE 0 END),
+                    SUM(CASE WHEN je.entry_type = 'credit' THEN je.amount ELSE 0 END),
+                    MAX(t.created_at)
+                FROM journal_entries je
+                JOIN transactions t ON je.transaction_id = t.id
+                WHERE NOT EXISTS (SELECT 1 FROM account_balances)
+                GROUP BY t.user_id, je.account_name
+            """)
+
+            # Per-user entry counts and totals by action, for /summary
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ledger_summary (
+                    user_id TEXT NOT NULL CHECK(length(user_id) > 0),
+                    action TEXT NOT NULL CHECK(
+                        action IN ('incoming', 'outgoing', 'transfer')
+                    ),
+                    entry_count INTEGER NOT NULL DEFAULT 0,
+                    amount_total REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (user_id, action)
+                )
+            """)
+
+            # Backfill summaries for databases created before the table existed
+            conn.execute("""
+                INSERT INTO ledger_summary (user_id, action, entry_count, amount_total)
+                SELECT user_id, action, COUNT(*), SUM(amount)
+                FROM ledger_entries
+                WHERE NOT EXISTS (SELECT 1 FROM ledger_summary)
+                GROUP BY user_id, action
+            """)
+
             # Create indexes for performance
             self._create_indexes(conn)
 
@@ -182,7 +329,12 @@ class BaseRepository:
             ("idx_account_groups_user_id", "account_groups", "user_id"),
             ("idx_account_aliases_user_id", "account_aliases", "user_id"),
             ("idx_account_aliases_group_id", "account_aliases", "group_id"),
-            ("idx_account_aliases_lookup", "account_aliases", "alias, user_id"),
+            # Covers alias -> group_id lookups without reading the table
+            (
+                "idx_account_aliases_cover",
+                "account_aliases",
+                "alias, user_id, group_id",
+            ),
             ("idx_accounts_user_id", "accounts", "user_id"),
             ("idx_transactions_user_id", "transactions", "user_id"),
             ("idx_transactions_created_at", "transactions", "created_at"),
@@ -192,6 +344,11 @@ class BaseRepository:
             ("idx_ledger_created_at", "ledger_entries", "created_at"),
             ("idx_ledger_action", "ledger_entries", "action"),
             ("idx_ledger_user_created", "ledger_entries", "user_id, created_at DESC"),
+            (
+                "idx_ledger_user_action_created",
+                "ledger_entries",
+                "user_id, action, created_at DESC",
+            ),
         ]
 
         for index_name, table, columns in indexes:
@@ -199,3 +356,24 @@ class BaseRepository:
                 CREATE INDEX IF NOT EXISTS {index_name}
                 ON {table}({columns})
             """)
+
+        # Superseded by idx_account_aliases_cover
+        conn.execute("DROP INDEX IF EXISTS idx_account_aliases_lookup")
+
+        # Group names are unique per user regardless of case; this also
+        # serves the case-insensitive name lookups
+        try:
+            conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_account_groups_name_ci
+                ON account_groups(user_id, LOWER(name))
+            """)
+            conn.execute("DROP INDEX IF EXISTS idx_account_groups_lname")
+        except sqlite3.IntegrityError:
+            logger.warning(
+                "Some account group names differ only by case; "
+                "case-insensitive uniqueness is not enforced"
+            )
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_account_groups_lname
+                ON account_groups(user_id, LOWER(name))
+            """)
@@ -177,6 +177,12 @@ class BudgetRepository:
                 CREATE INDEX IF NOT EXISTS idx_budget_user_id
                 ON budget_config(user_id)
             """)
+
+            # Partial index covering only users who get the daily recap
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_budget_recap_enabled
+                ON budget_config(user_id) WHERE daily_recap_enabled = 1
+            """)
             logger.debug("Budget schema initialized successfully")
 
     def get_by_user(self, user_id: str) -> Optional[BudgetConfig]:
@@ -421,3 +427,25 @@ class BudgetRepository:
         except Exception as e:
             logger.error(f"Error getting all users with config: {e}", exc_info=True)
             raise
+
+    def get_all_with_daily_recap_enabled(self) -> dict[str, BudgetConfig]:
+        """
+        Get the budget configs of all users with daily recap enabled.
+
+        Lets the daily recap run load every config in one query instead
+        of one get_by_user call per user.
+
+        Returns:
+            Dict mapping user ID to that user's BudgetConfig
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    "SELECT * FROM budget_config WHERE daily_recap_enabled = 1"
+                )
+                configs = {row[1]: BudgetConfig.from_row(row) for row in cursor}
+                logger.debug(f"Found {len(configs)} users with daily recap enabled")
+                return configs
+        except Exception as e:
+            logger.error(f"Error getting recap-enabled configs: {e}", exc_info=True)
+            raise
@@ -11,6 +11,10 @@ from typing import Optional
 
 from yuuka.models.account import AccountType, EntryType
 
+# Enum members by stored value; a dict lookup skips Enum.__call__ per row
+_ACCOUNT_TYPES = {t.value: t for t in AccountType}
+_ENTRY_TYPES = {t.value: t for t in EntryType}
+
 
 @dataclass
 class AccountGroup:
@@ -48,7 +52,7 @@ class AccountGroup:
         return cls(
             id=row[0],
             name=row[1],
-            account_type=AccountType(row[2]),
+            account_type=_ACCOUNT_TYPES[row[2]],
             user_id=row[3],
             description=row[4],
             is_system=bool(row[5]),
@@ -135,7 +139,7 @@ class Account:
         return cls(
             id=row[0],
             name=row[1],
-            account_type=AccountType(row[2]),
+            account_type=_ACCOUNT_TYPES[row[2]],
             user_id=row[3],
             description=row[4],
             is_system=bool(row[5]),
@@ -178,7 +182,7 @@ class JournalEntry:
             transaction_id=row[1],
             account_id=row[2],
             account_name=row[3],
-            entry_type=EntryType(row[4]),
+            entry_type=_ENTRY_TYPES[row[4]],
             amount=row[5],
         )
 
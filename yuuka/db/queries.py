@@ -12,7 +12,7 @@ import logging
 from datetime import date, datetime
 from typing import Any, Optional
 
-from yuuka.models.account import AccountType, EntryType
+from yuuka.models.account import AccountType
 
 from .base import BaseRepository
 from .models import LedgerEntry
@@ -53,100 +53,39 @@ class QueryRepository(BaseRepository):
             user_id: Discord user ID
 
         Returns:
-            Dictionary mapping account names to their balances
+            Dictionary mapping account names to their balances, ordered by
+            balance descending
         """
         if not user_id or not isinstance(user_id, str):
             raise ValueError(f"Invalid user_id: {user_id}")
 
         try:
             with self._get_connection() as conn:
-                # Get all journal entries grouped by account name and entry type
+                # Sign each account's running totals by its normal balance:
+                # asset/expense accounts are debit-normal, everything else is
+                # credit-normal. The type comes from account_groups, then the
+                # legacy accounts table, defaulting to asset.
                 cursor = conn.execute(
                     """
                     SELECT
-                        je.account_name as name,
-                        je.entry_type,
-                        SUM(je.amount) as total
-                    FROM journal_entries je
-                    JOIN transactions t ON je.transaction_id = t.id
-                    WHERE t.user_id = ?
-                    GROUP BY je.account_name, je.entry_type
+                        b.account_name AS name,
+                        CASE
+                            WHEN COALESCE(g.account_type, a.account_type, 'asset')
+                                 IN ('asset', 'expense')
+                            THEN b.debit_sum - b.credit_sum
+                            ELSE b.credit_sum - b.debit_sum
+                        END AS balance
+                    FROM account_balances b
+                    LEFT JOIN account_groups g
+                        ON g.user_id = b.user_id AND g.name = b.account_name
+                    LEFT JOIN accounts a
+                        ON a.user_id = b.user_id AND a.name = b.account_name
+                    WHERE b.user_id = ?
+                    ORDER BY balance DESC
                     """,
                     (user_id,),
                 )
-
-                # Calculate balances using proper accounting rules
-                account_debits: dict[str, float] = {}
-                account_credits: dict[str, float] = {}
-                account_types: dict[str, AccountType] = {}
-
-                rows = cursor.fetchall()
-
-                # First pass: collect debits and credits
-                for row in rows:
-                    account_name = row["name"]
-                    entry_type = EntryType(row["entry_type"])
-                    amount = row["total"] or 0.0
-
-                    if account_name not in account_debits:
-                        account_debits[account_name] = 0.0
-                        account_credits[account_name] = 0.0
-
-                    if entry_type == EntryType.DEBIT:
-                        account_debits[account_name] += amount
-                    else:
-                        account_credits[account_name] += amount
-
-                # Second pass: lookup account types by name
-                for account_name in account_debits.keys():
-                    # Try account_groups first
-                    type_cursor = conn.execute(
-                        """
-                        SELECT account_type FROM account_groups
-                        WHERE name = ? AND user_id = ?
-                        """,
-                        (account_name, user_id),
-                    )
-                    type_row = type_cursor.fetchone()
-
-                    if type_row:
-                        account_types[account_name] = AccountType(
-                            type_row["account_type"]
-                        )
-                    else:
-                        # Fall back to accounts table
-                        type_cursor = conn.execute(
-                            """
-                            SELECT account_type FROM accounts
-                            WHERE name = ? AND user_id = ?
-                            """,
-                            (account_name, user_id),
-                        )
-                        type_row = type_cursor.fetchone()
-
-                        if type_row:
-                            account_types[account_name] = AccountType(
-                                type_row["account_type"]
-                            )
-                        else:
-                            # Default to asset if not found anywhere
-                            account_types[account_name] = AccountType.ASSET
-
-                # Calculate final balances based on account type
-                balances: dict[str, float] = {}
-                debit_normal_types = {AccountType.ASSET, AccountType.EXPENSE}
-
-                for account_name in account_types:
-                    account_type = account_types[account_name]
-                    debit_total = account_debits[account_name]
-                    credit_total = account_credits[account_name]
-
-                    if account_type in debit_normal_types:
-                        # Asset/Expense: Debits increase, Credits decrease
-                        balances[account_name] = debit_total - credit_total
-                    else:
-                        # Liability/Equity/Revenue: Credits increase, Debits decrease
-                        balances[account_name] = credit_total - debit_total
+                balances = {row["name"]: row["balance"] for row in cursor.fetchall()}
 
                 logger.debug(
                     f"Calculated balances for {len(balances)} accounts "
@@ -579,56 +518,7 @@ class QueryRepository(BaseRepository):
         Returns:
             Dictionary with trial balance data
         """
-        if not user_id:
-            raise ValueError("User ID is required")
-
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.execute(
-                    """
-                    SELECT
-                        je.account_name as name,
-                        je.entry_type,
-                        SUM(je.amount) as total
-                    FROM journal_entries je
-                    JOIN transactions t ON je.transaction_id = t.id
-                    WHERE t.user_id = ?
-                    GROUP BY je.account_name, je.entry_type
-                    ORDER BY je.account_name
-                    """,
-                    (user_id,),
-                )
-
-                accounts: dict[str, dict[str, float]] = {}
-                total_debits = 0.0
-                total_credits = 0.0
-
-                for row in cursor.fetchall():
-                    name = row["name"]
-                    entry_type = row["entry_type"]
-                    amount = row["total"] or 0.0
-
-                    if name not in accounts:
-                        accounts[name] = {"debit": 0.0, "credit": 0.0}
-
-                    accounts[name][entry_type] = amount
-
-                    if entry_type == "debit":
-                        total_debits += amount
-                    else:
-                        total_credits += amount
-
-                return {
-                    "accounts": accounts,
-                    "total_debits": total_debits,
-                    "total_credits": total_credits,
-                    "is_balanced": abs(total_debits - total_credits) < 0.01,
-                }
-        except ValueError:
-            raise
-        except Exception as e:
-            logger.error(f"Error generating trial balance: {e}", exc_info=True)
-            raise
+        return self.get_financial_snapshot(user_id)["trial_balance"]
 
     def get_income_statement(
         self,
@@ -652,6 +542,10 @@ class QueryRepository(BaseRepository):
         if not user_id:
             raise ValueError("User ID is required")
 
+        # All-time statements come straight from the shared snapshot
+        if start_date is None and end_date is None:
+            return self.get_financial_snapshot(user_id)["income_statement"]
+
         try:
             with self._get_connection() as conn:
                 # Build date filter
@@ -737,163 +631,228 @@ class QueryRepository(BaseRepository):
             user_id: Discord user ID
 
         Returns:
-            Dictionary with balance sheet data
+            Dictionary with balance sheet data; each section is ordered by
+            balance descending
+        """
+        return self.get_financial_snapshot(user_id)["balance_sheet"]
+
+    def get_financial_snapshot(self, user_id: str) -> dict[str, Any]:
+        """
+        Generate the trial balance, income statement and balance sheet at once.
+
+        All three reports are derived from one set of per-account debit/credit
+        totals, so a single aggregate query replaces a scan per report.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            Dictionary with "trial_balance", "income_statement" and
+            "balance_sheet" keys, each shaped like its individual report
         """
         if not user_id:
             raise ValueError("User ID is required")
 
         try:
-            balances = self.get_user_balance_by_account(user_id)
-
             with self._get_connection() as conn:
-                # Get account types by looking up account names
+                totals = self._get_account_totals(conn, user_id)
+
                 cursor = conn.execute(
-                    """
-                    SELECT DISTINCT je.account_name as name
-                    FROM journal_entries je
-                    JOIN transactions t ON je.transaction_id = t.id
-                    WHERE t.user_id = ?
-                    """,
+                    "SELECT name, account_type FROM account_groups WHERE user_id = ?",
                     (user_id,),
                 )
+                group_types = {
+                    row["name"]: AccountType(row["account_type"])
+                    for row in cursor.fetchall()
+                }
 
-                account_names = [row["name"] for row in cursor.fetchall()]
-                account_types = {}
-
-                for name in account_names:
-                    # Try to find in account_groups first
-                    group_cursor = conn.execute(
-                        """
-                        SELECT account_type FROM account_groups
-                        WHERE name = ? AND user_id = ?
-                        """,
-                        (name, user_id),
-                    )
-                    group_row = group_cursor.fetchone()
-
-                    if group_row:
-                        account_types[name] = AccountType(group_row["account_type"])
-                    else:
-                        # Fall back to accounts table
-                        account_cursor = conn.execute(
-                            """
-                            SELECT account_type FROM accounts
-                            WHERE name = ? AND user_id = ?
-                            """,
-                            (name, user_id),
-                        )
-                        account_row = account_cursor.fetchone()
-
-                        if account_row:
-                            account_types[name] = AccountType(
-                                account_row["account_type"]
-                            )
-                        else:
-                            # Default to asset if not found
-                            account_types[name] = AccountType.ASSET
-
-            # Aggregate balances by resolved group names
-            aggregated_balances = {}
-            aggregated_types = {}
-
-            for account_name, balance in balances.items():
-                account_type = account_types.get(account_name, AccountType.ASSET)
-
-                # Try to resolve to group name if it's an alias
-                with self._get_connection() as conn:
-                    cursor = conn.execute(
-                        """
-                        SELECT g.name
-                        FROM account_groups g
-                        JOIN account_aliases a ON g.id = a.group_id
-                        WHERE a.alias = ? AND a.user_id = ?
-                        """,
-                        (account_name.lower(), user_id),
-                    )
-                    row = cursor.fetchone()
-                    display_name = row["name"] if row else account_name
-
-                # Aggregate balances with same display name
-                if display_name not in aggregated_balances:
-                    aggregated_balances[display_name] = 0.0
-                    aggregated_types[display_name] = account_type
-
-                aggregated_balances[display_name] += balance
+                cursor = conn.execute(
+                    "SELECT name, account_type FROM accounts WHERE user_id = ?",
+                    (user_id,),
+                )
+                legacy_types = {
+                    row["name"]: AccountType(row["account_type"])
+                    for row in cursor.fetchall()
+                }
 
-            # Get last transaction timestamp for each account
-            last_used_timestamps = {}
-            with self._get_connection() as conn:
-                for display_name in aggregated_balances.keys():
-                    cursor = conn.execute(
-                        """
-                        SELECT MAX(t.created_at) as last_used
-                        FROM journal_entries je
-                        JOIN transactions t ON je.transaction_id = t.id
-                        WHERE je.account_name = ? AND t.user_id = ?
-                        """,
-                        (display_name, user_id),
-                    )
-                    row = cursor.fetchone()
-                    if row and row["last_used"]:
-                        last_used_timestamps[display_name] = row["last_used"]
-
-            # Build balance sheet from aggregated data
-            assets = []
-            liabilities = []
-            equity = []
-            total_assets = 0.0
-            total_liabilities = 0.0
-            total_equity = 0.0
-
-            for display_name, balance in aggregated_balances.items():
-                account_type = aggregated_types[display_name]
-                last_used = last_used_timestamps.get(display_name)
-
-                if account_type == AccountType.ASSET:
-                    assets.append(
-                        {
-                            "name": display_name,
-                            "amount": balance,
-                            "last_used": last_used,
-                        }
-                    )
-                    total_assets += balance
-                elif account_type == AccountType.LIABILITY:
-                    liabilities.append(
-                        {
-                            "name": display_name,
-                            "amount": balance,
-                            "last_used": last_used,
-                        }
-                    )
-                    total_liabilities += balance
-                elif account_type == AccountType.EQUITY:
-                    equity.append(
-                        {
-                            "name": display_name,
-                            "amount": balance,
-                            "last_used": last_used,
-                        }
-                    )
-                    total_equity += balance
-                # Revenue and Expense contribute to retained earnings
-                elif account_type == AccountType.REVENUE:
-                    total_equity += balance
-                elif account_type == AccountType.EXPENSE:
-                    total_equity -= balance
+                cursor = conn.execute(
+                    """
+                    SELECT a.alias, g.name
+                    FROM account_aliases a
+                    JOIN account_groups g ON g.id = a.group_id
+                    WHERE a.user_id = ?
+                    """,
+                    (user_id,),
+                )
+                alias_names = {row["alias"]: row["name"] for row in cursor.fetchall()}
 
             return {
-                "assets": assets,
-                "liabilities": liabilities,
-                "equity": equity,
-                "total_assets": total_assets,
-                "total_liabilities": total_liabilities,
-                "total_equity": total_equity,
-                "is_balanced": abs(total_assets - (total_liabilities + total_equity))
-                < 0.01,
+                "trial_balance": self._build_trial_balance(totals),
+                "income_statement": self._build_income_statement(totals, group_types),
+                "balance_sheet": self._build_balance_sheet(
+                    totals, group_types, legacy_types, alias_names
+                ),
             }
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Error generating balance sheet: {e}", exc_info=True)
+            logger.error(f"Error generating financial snapshot: {e}", exc_info=True)
             raise
+
+    def _get_account_totals(self, conn, user_id: str) -> list[dict[str, Any]]:
+        """
+        Get debit/credit totals and last use per account name, ordered by name.
+
+        Reads the account_balances table, which the transaction repository
+        keeps up to date on every write, instead of aggregating the journal.
+
+        Args:
+            conn: Open database connection
+            user_id: Discord user ID
+
+        Returns:
+            List of {name, debit, credit, last_used} dictionaries
+        """
+        cursor = conn.execute(
+            """
+            SELECT account_name, debit_sum, credit_sum, last_used
+            FROM account_balances
+            WHERE user_id = ?
+            ORDER BY account_name
+            """,
+            (user_id,),
+        )
+        return [
+            {
+                "name": row["account_name"],
+                "debit": row["debit_sum"],
+                "credit": row["credit_sum"],
+                "last_used": row["last_used"],
+            }
+            for row in cursor.fetchall()
+        ]
+
+    @staticmethod
+    def _build_trial_balance(totals: list[dict[str, Any]]) -> dict[str, Any]:
+        """Build a trial balance report from per-account totals."""
+        accounts: dict[str, dict[str, float]] = {}
+        total_debits = 0.0
+        total_credits = 0.0
+
+        for row in totals:
+            accounts[row["name"]] = {"debit": row["debit"], "credit": row["credit"]}
+            total_debits += row["debit"]
+            total_credits += row["credit"]
+
+        return {
+            "accounts": accounts,
+            "total_debits": total_debits,
+            "total_credits": total_credits,
+            "difference": total_debits - total_credits,
+            "is_balanced": abs(total_debits - total_credits) < 0.01,
+        }
+
+    @staticmethod
+    def _build_income_statement(
+        totals: list[dict[str, Any]],
+        group_types: dict[str, AccountType],
+    ) -> dict[str, Any]:
+        """Build an all-time income statement from per-account totals."""
+        revenue = []
+        expenses = []
+        total_revenue = 0.0
+        total_expenses = 0.0
+
+        for row in totals:
+            account_type = group_types.get(row["name"])
+            if account_type == AccountType.REVENUE and row["credit"]:
+                revenue.append({"name": row["name"], "amount": row["credit"]})
+                total_revenue += row["credit"]
+            elif account_type == AccountType.EXPENSE and row["debit"]:
+                expenses.append({"name": row["name"], "amount": row["debit"]})
+                total_expenses += row["debit"]
+
+        return {
+            "revenue": revenue,
+            "expenses": expenses,
+            "total_revenue": total_revenue,
+            "total_expenses": total_expenses,
+            "net_income": total_revenue - total_expenses,
+        }
+
+    @staticmethod
+    def _build_balance_sheet(
+        totals: list[dict[str, Any]],
+        group_types: dict[str, AccountType],
+        legacy_types: dict[str, AccountType],
+        alias_names: dict[str, str],
+    ) -> dict[str, Any]:
+        """Build a balance sheet from per-account totals and type lookups."""
+        debit_normal_types = {AccountType.ASSET, AccountType.EXPENSE}
+        last_used_by_name = {row["name"]: row["last_used"] for row in totals}
+
+        # Aggregate balances by resolved group names
+        aggregated_balances: dict[str, float] = {}
+        aggregated_types: dict[str, AccountType] = {}
+
+        for row in totals:
+            account_name = row["name"]
+            account_type = (
+                group_types.get(account_name)
+                or legacy_types.get(account_name)
+                or AccountType.ASSET
+            )
+            if account_type in debit_normal_types:
+                balance = row["debit"] - row["credit"]
+            else:
+                balance = row["credit"] - row["debit"]
+
+            display_name = alias_names.get(account_name.lower(), account_name)
+            if display_name not in aggregated_balances:
+                aggregated_balances[display_name] = 0.0
+                aggregated_types[display_name] = account_type
+            aggregated_balances[display_name] += balance
+
+        # Build balance sheet from aggregated data, largest balances first
+        assets = []
+        liabilities = []
+        equity = []
+        total_assets = 0.0
+        total_liabilities = 0.0
+        total_equity = 0.0
+
+        for display_name, balance in sorted(
+            aggregated_balances.items(), key=lambda item: item[1], reverse=True
+        ):
+            account_type = aggregated_types[display_name]
+            item = {
+                "name": display_name,
+                "amount": balance,
+                "last_used": last_used_by_name.get(display_name),
+            }
+
+            if account_type == AccountType.ASSET:
+                assets.append(item)
+                total_assets += balance
+            elif account_type == AccountType.LIABILITY:
+                liabilities.append(item)
+                total_liabilities += balance
+            elif account_type == AccountType.EQUITY:
+                equity.append(item)
+                total_equity += balance
+            # Revenue and Expense contribute to retained earnings
+            elif account_type == AccountType.REVENUE:
+                total_equity += balance
+            elif account_type == AccountType.EXPENSE:
+                total_equity -= balance
+
+        return {
+            "assets": assets,
+            "liabilities": liabilities,
+            "equity": equity,
+            "total_assets": total_assets,
+            "total_liabilities": total_liabilities,
+            "total_equity": total_equity,
+            "is_balanced": abs(total_assets - (total_liabilities + total_equity))
+            < 0.01,
+        }
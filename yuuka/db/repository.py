@@ -120,6 +120,10 @@ class LedgerRepository(BaseRepository):
         """Resolve an alias to its account group."""
         return self._account_repo.resolve_account_alias(alias, user_id)
 
+    def resolve_account_group_id(self, alias: str, user_id: str) -> Optional[int]:
+        """Resolve an alias to its account group's ID."""
+        return self._account_repo.resolve_account_group_id(alias, user_id)
+
     def remove_account_alias(self, alias: str, user_id: str) -> bool:
         """Remove an alias."""
         return self._account_repo.remove_account_alias(alias, user_id)
@@ -220,6 +224,18 @@ class LedgerRepository(BaseRepository):
         """Get ledger entries for a user."""
         return self._transaction_repo.get_user_entries(user_id, limit, offset, action)
 
+    def get_user_entries_with_total(
+        self,
+        user_id: str,
+        limit: int = 10,
+        offset: int = 0,
+        action: Optional[TransactionAction] = None,
+    ) -> tuple[list[LedgerEntry], int]:
+        """Get a page of ledger entries and the total matching count."""
+        return self._transaction_repo.get_user_entries_with_total(
+            user_id, limit, offset, action
+        )
+
     def get_user_summary(self, user_id: str) -> dict[str, Any]:
         """Get a summary of a user's ledger."""
         return self._transaction_repo.get_user_summary(user_id)
@@ -232,6 +248,14 @@ class LedgerRepository(BaseRepository):
         """Count total entries for a user."""
         return self._transaction_repo.count_user_entries(user_id, action)
 
+    def get_user_ids_with_entries(self) -> set[str]:
+        """Get the IDs of all users who have at least one ledger entry."""
+        return self._transaction_repo.get_user_ids_with_entries()
+
+    def rebuild_summaries(self, user_id: str):
+        """Rebuild a user's maintained account totals and ledger summary."""
+        self._transaction_repo.rebuild_summaries(user_id)
+
     def update_transaction(
         self,
         transaction_id: int,
@@ -251,7 +275,7 @@ class LedgerRepository(BaseRepository):
             new_description,
         )
 
-    def delete_entry(self, entry_id: int, user_id: str) -> bool:
+    def delete_entry(self, entry_id: int, user_id: str) -> Optional[LedgerEntry]:
         """Delete a ledger entry and its associated double-entry transaction."""
         return self._transaction_repo.delete_entry(entry_id, user_id)
 
@@ -338,6 +362,10 @@ class LedgerRepository(BaseRepository):
         """Generate a balance sheet."""
         return self._query_repo.get_balance_sheet(user_id)
 
+    def get_financial_snapshot(self, user_id: str) -> dict[str, Any]:
+        """Generate trial balance, income statement and balance sheet together."""
+        return self._query_repo.get_financial_snapshot(user_id)
+
 
 # Module-level singleton for convenience
 _repository: Optional[LedgerRepository] = None
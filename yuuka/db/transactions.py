@@ -238,34 +238,45 @@ class TransactionRepository(BaseRepository):
                     credit_group.id if credit_group else credit_account.id
                 )
 
-                conn.execute(
+                # One prepared statement, bound once per side
+                conn.executemany(
                     """
                     INSERT INTO journal_entries (
                         transaction_id, account_id, account_name, entry_type, amount
                     ) VALUES (?, ?, ?, ?, ?)
                     """,
                     (
-                        transaction_id,
-                        debit_journal_account_id,
-                        debit_display_name,
-                        EntryType.DEBIT.value,
-                        parsed.amount,
+                        (
+                            transaction_id,
+                            debit_journal_account_id,
+                            debit_display_name,
+                            EntryType.DEBIT.value,
+                            parsed.amount,
+                        ),
+                        (
+                            transaction_id,
+                            credit_journal_account_id,
+                            credit_display_name,
+                            EntryType.CREDIT.value,
+                            parsed.amount,
+                        ),
                     ),
                 )
 
-                conn.execute(
-                    """
-                    INSERT INTO journal_entries (
-                        transaction_id, account_id, account_name, entry_type, amount
-                    ) VALUES (?, ?, ?, ?, ?)
-                    """,
-                    (
-                        transaction_id,
-                        credit_journal_account_id,
-                        credit_display_name,
-                        EntryType.CREDIT.value,
-                        parsed.amount,
-                    ),
+                # Keep the materialized per-account totals in step
+                self._add_to_account_balance(
+                    conn,
+                    user_id,
+                    debit_display_name,
+                    debit=parsed.amount,
+                    last_used=created_at.isoformat(),
+                )
+                self._add_to_account_balance(
+                    conn,
+                    user_id,
+                    credit_display_name,
+                    credit=parsed.amount,
+                    last_used=created_at.isoformat(),
                 )
 
                 # Create legacy ledger entry for backward compatibility
@@ -296,6 +307,9 @@ class TransactionRepository(BaseRepository):
                 )
 
                 entry_id = cursor.lastrowid
+                self._add_to_ledger_summary(
+                    conn, user_id, parsed.action.value, parsed.amount
+                )
                 logger.info(
                     f"Inserted double-entry transaction {transaction_id} "
                     f"(ledger entry {entry_id}) for user {user_id}: "
@@ -437,23 +451,7 @@ class TransactionRepository(BaseRepository):
                 if not row:
                     return None
 
-                return LedgerEntry(
-                    id=row[0],
-                    action=row[1],
-                    amount=row[2],
-                    source=row[3],
-                    destination=row[4],
-                    description=row[5],
-                    raw_text=row[6],
-                    confidence=row[7],
-                    user_id=row[8],
-                    guild_id=row[9],
-                    channel_id=row[10],
-                    message_id=row[11],
-                    created_at=datetime.fromisoformat(row[12]),
-                    confirmed=bool(row[13]),
-                    transaction_id=row[14],
-                )
+                return LedgerEntry.from_row(row)
         except ValueError:
             raise
         except Exception as e:
@@ -548,6 +546,94 @@ class TransactionRepository(BaseRepository):
             )
             raise
 
+    def get_user_entries_with_total(
+        self,
+        user_id: str,
+        limit: int = 10,
+        offset: int = 0,
+        action: Optional[TransactionAction] = None,
+    ) -> tuple[list[LedgerEntry], int]:
+        """
+        Get a page of ledger entries together with the total matching count.
+
+        The count comes from a scalar subquery on the maintained
+        ledger_summary table in the same statement, so a paged listing needs
+        one round-trip and never counts the user's rows one by one.
+
+        Args:
+            user_id: Discord user ID
+            limit: Maximum number of entries to return
+            offset: Number of entries to skip
+            action: Optional filter by action type
+
+        Returns:
+            Tuple of (entries, total number of matching entries)
+        """
+        if not user_id or not isinstance(user_id, str):
+            raise ValueError(f"Invalid user_id: {user_id}")
+
+        if limit <= 0 or limit > 100:
+            limit = 10
+        if offset < 0:
+            offset = 0
+
+        try:
+            with self._get_connection() as conn:
+                if action:
+                    cursor = conn.execute(
+                        """
+                        SELECT id, action, amount, source, destination, description,
+                               raw_text, confidence, user_id, guild_id, channel_id,
+                               message_id, created_at, confirmed, transaction_id,
+                               (SELECT COALESCE(SUM(entry_count), 0)
+                                FROM ledger_summary
+                                WHERE user_id = ? AND action = ?) AS total
+                        FROM ledger_entries
+                        WHERE user_id = ? AND action = ?
+                        ORDER BY created_at DESC
+                        LIMIT ? OFFSET ?
+                        """,
+                        (user_id, action.value, user_id, action.value, limit, offset),
+                    )
+                else:
+                    cursor = conn.execute(
+                        """
+                        SELECT id, action, amount, source, destination, description,
+                               raw_text, confidence, user_id, guild_id, channel_id,
+                               message_id, created_at, confirmed, transaction_id,
+                               (SELECT COALESCE(SUM(entry_count), 0)
+                                FROM ledger_summary
+                                WHERE user_id = ?) AS total
+                        FROM ledger_entries
+                        WHERE user_id = ?
+                        ORDER BY created_at DESC
+                        LIMIT ? OFFSET ?
+                        """,
+                        (user_id, user_id, limit, offset),
+                    )
+
+                rows = cursor.fetchall()
+
+            if not rows:
+                # An empty page carries no count; only past-the-end pages
+                # need the separate query
+                total = self.count_user_entries(user_id, action) if offset else 0
+                return [], total
+
+            entries = [LedgerEntry.from_row(row) for row in rows]
+            logger.debug(
+                f"Retrieved {len(entries)} of {rows[0]['total']} entries "
+                f"for user {user_id}"
+            )
+            return entries, rows[0]["total"]
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error getting entries for user {user_id}: {e}", exc_info=True
+            )
+            raise
+
     def get_user_summary(self, user_id: str) -> dict[str, Any]:
         """
         Get a summary of a user's ledger.
@@ -565,10 +651,9 @@ class TransactionRepository(BaseRepository):
             with self._get_connection() as conn:
                 cursor = conn.execute(
                     """
-                    SELECT action, COUNT(*) as count, SUM(amount) as total
-                    FROM ledger_entries
+                    SELECT action, entry_count as count, amount_total as total
+                    FROM ledger_summary
                     WHERE user_id = ?
-                    GROUP BY action
                     """,
                     (user_id,),
                 )
@@ -616,6 +701,9 @@ class TransactionRepository(BaseRepository):
         """
         Count total entries for a user.
 
+        Reads the per-action counts kept in ledger_summary rather than
+        counting ledger_entries rows.
+
         Args:
             user_id: Discord user ID
             action: Optional filter by action type
@@ -631,7 +719,7 @@ class TransactionRepository(BaseRepository):
                 if action:
                     cursor = conn.execute(
                         """
-                        SELECT COUNT(*) FROM ledger_entries
+                        SELECT COALESCE(SUM(entry_count), 0) FROM ledger_summary
                         WHERE user_id = ? AND action = ?
                         """,
                         (user_id, action.value),
@@ -639,7 +727,7 @@ class TransactionRepository(BaseRepository):
                 else:
                     cursor = conn.execute(
                         """
-                        SELECT COUNT(*) FROM ledger_entries
+                        SELECT COALESCE(SUM(entry_count), 0) FROM ledger_summary
                         WHERE user_id = ?
                         """,
                         (user_id,),
@@ -654,6 +742,21 @@ class TransactionRepository(BaseRepository):
             )
             raise
 
+    def get_user_ids_with_entries(self) -> set[str]:
+        """
+        Get the IDs of all users who have at least one ledger entry.
+
+        Returns:
+            Set of Discord user IDs
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute("SELECT DISTINCT user_id FROM ledger_entries")
+                return {row["user_id"] for row in cursor.fetchall()}
+        except Exception as e:
+            logger.error(f"Error getting users with entries: {e}", exc_info=True)
+            raise
+
     # =========================================================================
     # Update Operations
     # =========================================================================
@@ -782,12 +885,13 @@ class TransactionRepository(BaseRepository):
                 # Update journal entries
                 cursor = conn.execute(
                     """
-                    SELECT id, entry_type FROM journal_entries
+                    SELECT id, entry_type, account_name FROM journal_entries
                     WHERE transaction_id = ?
                     """,
                     (transaction_id,),
                 )
                 journal_entries = cursor.fetchall()
+                affected_accounts = {je["account_name"] for je in journal_entries}
 
                 for je in journal_entries:
                     if je["entry_type"] == "debit":
@@ -809,6 +913,11 @@ class TransactionRepository(BaseRepository):
                             (final_amount, credit_name or "Unknown", je["id"]),
                         )
 
+                affected_accounts.update(
+                    (debit_name or "Unknown", credit_name or "Unknown")
+                )
+                self._refresh_account_balances(conn, user_id, affected_accounts)
+
                 # Update the transaction description
                 conn.execute(
                     """
@@ -834,6 +943,8 @@ class TransactionRepository(BaseRepository):
                         ledger_entry_id,
                     ),
                 )
+                if final_amount != current_amount:
+                    self._refresh_ledger_summary(conn, user_id)
 
                 logger.info(
                     f"Updated transaction {transaction_id} for user {user_id}: "
@@ -856,16 +967,19 @@ class TransactionRepository(BaseRepository):
     # Delete Operations
     # =========================================================================
 
-    def delete_entry(self, entry_id: int, user_id: str) -> bool:
+    def delete_entry(self, entry_id: int, user_id: str) -> Optional[LedgerEntry]:
         """
         Delete a ledger entry and its associated double-entry transaction.
 
+        Ownership is enforced in the DELETE itself, so there is no separate
+        read between the authorization check and the mutation.
+
         Args:
             entry_id: Entry ID to delete
             user_id: User ID (for authorization)
 
         Returns:
-            True if deleted, False if not found or not authorized
+            The deleted LedgerEntry, or None if not found or not authorized
         """
         if entry_id <= 0:
             raise ValueError(f"Invalid entry_id: {entry_id}")
@@ -874,33 +988,35 @@ class TransactionRepository(BaseRepository):
 
         try:
             with self._get_connection() as conn:
-                # Get the entry and verify ownership
                 cursor = conn.execute(
                     """
-                    SELECT transaction_id, user_id FROM ledger_entries
-                    WHERE id = ?
+                    DELETE FROM ledger_entries
+                    WHERE id = ? AND user_id = ?
+                    RETURNING id, action, amount, source, destination, description,
+                              raw_text, confidence, user_id, guild_id, channel_id,
+                              message_id, created_at, confirmed, transaction_id
                     """,
-                    (entry_id,),
+                    (entry_id, user_id),
                 )
                 row = cursor.fetchone()
 
                 if not row:
-                    return False
-
-                if row["user_id"] != user_id:
-                    logger.warning(
-                        f"User {user_id} attempted to delete entry {entry_id} "
-                        f"owned by {row['user_id']}"
-                    )
-                    return False
-
-                transaction_id = row["transaction_id"]
+                    return None
 
-                # Delete the ledger entry
-                conn.execute("DELETE FROM ledger_entries WHERE id = ?", (entry_id,))
+                entry = LedgerEntry.from_row(tuple(row))
+                transaction_id = entry.transaction_id
 
                 # Delete associated transaction and journal entries (cascade)
                 if transaction_id:
+                    cursor = conn.execute(
+                        """
+                        SELECT DISTINCT account_name FROM journal_entries
+                        WHERE transaction_id = ?
+                        """,
+                        (transaction_id,),
+                    )
+                    affected_accounts = {r["account_name"] for r in cursor.fetchall()}
+
                     conn.execute(
                         "DELETE FROM journal_entries WHERE transaction_id = ?",
                         (transaction_id,),
@@ -908,14 +1024,218 @@ class TransactionRepository(BaseRepository):
                     conn.execute(
                         "DELETE FROM transactions WHERE id = ?", (transaction_id,)
                     )
+                    self._refresh_account_balances(conn, user_id, affected_accounts)
+
+                self._remove_from_ledger_summary(
+                    conn, user_id, entry.action, entry.amount
+                )
 
                 logger.info(
                     f"Deleted entry {entry_id} and transaction {transaction_id} "
                     f"for user {user_id}"
                 )
-                return True
+                return entry
         except ValueError:
             raise
         except Exception as e:
             logger.error(f"Error deleting entry {entry_id}: {e}", exc_info=True)
             raise
+
+    # =========================================================================
+    # Summary Table Maintenance
+    # =========================================================================
+
+    def _add_to_account_balance(
+        self,
+        conn,
+        user_id: str,
+        account_name: str,
+        debit: float = 0.0,
+        credit: float = 0.0,
+        last_used: Optional[str] = None,
+    ):
+        """
+        Incrementally add a journal entry's amount to the account totals.
+
+        Args:
+            conn: Open database connection (part of the writing transaction)
+            user_id: Discord user ID
+            account_name: Journal entry account name
+            debit: Debit amount to add
+            credit: Credit amount to add
+            last_used: ISO timestamp of the transaction
+        """
+        conn.execute(
+            """
+            INSERT INTO account_balances
+                (user_id, account_name, debit_sum, credit_sum, last_used)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (user_id, account_name) DO UPDATE SET
+                debit_sum = debit_sum + excluded.debit_sum,
+                credit_sum = credit_sum + excluded.credit_sum,
+                last_used = MAX(COALESCE(last_used, ''), excluded.last_used)
+            """,
+            (user_id, account_name, debit, credit, last_used),
+        )
+
+    def _refresh_account_balances(
+        self,
+        conn,
+        user_id: str,
+        account_names: set[str],
+    ):
+        """
+        Recompute the account totals for the given accounts from journal entries.
+
+        Used after edits and deletes, where amounts and last-used timestamps
+        can't be adjusted incrementally.
+
+        Args:
+            conn: Open database connection (part of the writing transaction)
+            user_id: Discord user ID
+            account_names: Account names whose totals may have changed
+        """
+        for account_name in account_names:
+            conn.execute(
+                "DELETE FROM account_balances WHERE user_id = ? AND account_name = ?",
+                (user_id, account_name),
+            )
+            conn.execute(
+                """
+                INSERT INTO account_balances
+                    (user_id, account_name, debit_sum, credit_sum, last_used)
+                SELECT
+                    t.user_id,
+                    je.account_name,
+                    SUM(CASE WHEN je.entry_type = 'debit' THEN je.amount ELSE 0 END),
+                    SUM(CASE WHEN je.entry_type = 'credit' THEN je.amount ELSE 0 END),
+                    MAX(t.created_at)
+                FROM journal_entries je
+                JOIN transactions t ON je.transaction_id = t.id
+                WHERE t.user_id = ? AND je.account_name = ?
+                GROUP BY t.user_id, je.account_name
+                """,
+                (user_id, account_name),
+            )
+
+    def _add_to_ledger_summary(
+        self,
+        conn,
+        user_id: str,
+        action: str,
+        amount: float,
+    ):
+        """
+        Incrementally count a new ledger entry in the per-user summary.
+
+        Args:
+            conn: Open database connection (part of the writing transaction)
+            user_id: Discord user ID
+            action: Ledger entry action value
+            amount: Entry amount
+        """
+        conn.execute(
+            """
+            INSERT INTO ledger_summary (user_id, action, entry_count, amount_total)
+            VALUES (?, ?, 1, ?)
+            ON CONFLICT (user_id, action) DO UPDATE SET
+                entry_count = entry_count + 1,
+                amount_total = amount_total + excluded.amount_total
+            """,
+            (user_id, action, amount),
+        )
+
+    def _remove_from_ledger_summary(
+        self,
+        conn,
+        user_id: str,
+        action: str,
+        amount: float,
+    ):
+        """
+        Reverse a deleted ledger entry's contribution to the per-user summary.
+
+        Args:
+            conn: Open database connection (part of the writing transaction)
+            user_id: Discord user ID
+            action: Ledger entry action value
+            amount: Entry amount
+        """
+        conn.execute(
+            """
+            UPDATE ledger_summary
+            SET entry_count = entry_count - 1,
+                amount_total = amount_total - ?
+            WHERE user_id = ? AND action = ?
+            """,
+            (amount, user_id, action),
+        )
+        conn.execute(
+            """
+            DELETE FROM ledger_summary
+            WHERE user_id = ? AND action = ? AND entry_count <= 0
+            """,
+            (user_id, action),
+        )
+
+    def _refresh_ledger_summary(self, conn, user_id: str):
+        """
+        Recompute a user's per-action summary from their ledger entries.
+
+        Args:
+            conn: Open database connection (part of the writing transaction)
+            user_id: Discord user ID
+        """
+        conn.execute("DELETE FROM ledger_summary WHERE user_id = ?", (user_id,))
+        conn.execute(
+            """
+            INSERT INTO ledger_summary (user_id, action, entry_count, amount_total)
+            SELECT user_id, action, COUNT(*), SUM(amount)
+            FROM ledger_entries
+            WHERE user_id = ?
+            GROUP BY user_id, action
+            """,
+            (user_id,),
+        )
+
+    def rebuild_summaries(self, user_id: str):
+        """
+        Rebuild a user's account totals and ledger summary from scratch.
+
+        The maintained tables are normally kept in step by every write; this
+        recovers them if they ever drift (e.g. after manual database edits).
+
+        Args:
+            user_id: Discord user ID
+        """
+        if not user_id:
+            raise ValueError("User ID is required")
+
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute(
+                    """
+                    SELECT account_name FROM account_balances WHERE user_id = ?
+                    UNION
+                    SELECT je.account_name
+                    FROM journal_entries je
+                    JOIN transactions t ON je.transaction_id = t.id
+                    WHERE t.user_id = ?
+                    """,
+                    (user_id, user_id),
+                )
+                account_names = {row["account_name"] for row in cursor.fetchall()}
+                self._refresh_account_balances(conn, user_id, account_names)
+                self._refresh_ledger_summary(conn, user_id)
+
+                logger.info(
+                    f"Rebuilt summaries for user {user_id}: "
+                    f"{len(account_names)} accounts"
+                )
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error rebuilding summaries for user {user_id}: {e}", exc_info=True
+            )
+            raise
@@ -9,7 +9,7 @@ class TransactionAction(str, Enum):
     TRANSFER = "transfer"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedTransaction:
     """Structured output from NLP parsing of transaction text."""
 
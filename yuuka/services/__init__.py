@@ -3,6 +3,8 @@ from .export import ExportFormat, ExportService
 from .nlp_service import (
     TransactionNLPService,
     get_nlp_service,
+    init_parse_worker,
+    parse_batch_in_worker,
     parse_transaction,
 )
 
@@ -12,5 +14,7 @@ __all__ = [
     "ExportService",
     "TransactionNLPService",
     "get_nlp_service",
+    "init_parse_worker",
+    "parse_batch_in_worker",
     "parse_transaction",
 ]
@@ -46,6 +46,7 @@ class TransactionNLPService:
         Raises:
             RuntimeError: If the spaCy model is not installed
         """
+        self.model_name = model_name
         try:
             self.nlp = spacy.load(model_name)
             logger.info(f"Loaded spaCy model: {model_name}")
@@ -91,6 +92,25 @@ class TransactionNLPService:
         Raises:
             ValueError: If text is empty or invalid
         """
+        text = self._validate_text(text)
+
+        try:
+            doc = self.nlp(text)
+        except Exception as e:
+            logger.error(f"Error processing text with spaCy: {e}", exc_info=True)
+            # Return a low-confidence result rather than crashing
+            return self._failed_parse(text)
+
+        return self._parse_doc(text, doc)
+
+    @staticmethod
+    def _validate_text(text: str) -> str:
+        """
+        Validate and strip a transaction description.
+
+        Raises:
+            ValueError: If text is empty, not a string, or too long
+        """
         if not text or not isinstance(text, str):
             raise ValueError(f"Invalid text input: {text}")
 
@@ -102,23 +122,26 @@ class TransactionNLPService:
         if len(text) > 500:
             raise ValueError(f"Text too long (max 500 characters): {len(text)}")
 
+        return text
+
+    @staticmethod
+    def _failed_parse(text: str) -> ParsedTransaction:
+        """Build the zero-confidence result returned when parsing fails."""
+        return ParsedTransaction(
+            action=TransactionAction.OUTGOING,
+            amount=None,
+            source=None,
+            destination=None,
+            description=None,
+            raw_text=text,
+            confidence=0.0,
+        )
+
+    def _parse_doc(self, text: str, doc) -> ParsedTransaction:
+        """Extract transaction fields from validated text and its spaCy doc."""
         try:
             text_lower = text.lower()
-            doc = self.nlp(text)
-        except Exception as e:
-            logger.error(f"Error processing text with spaCy: {e}", exc_info=True)
-            # Return a low-confidence result rather than crashing
-            return ParsedTransaction(
-                action=TransactionAction.OUTGOING,
-                amount=None,
-                source=None,
-                destination=None,
-                description=None,
-                raw_text=text,
-                confidence=0.0,
-            )
 
-        try:
             # Extract components
             action = self._detect_action(text_lower, doc)
             amount = self._extract_amount(text)
@@ -148,15 +171,7 @@ class TransactionNLPService:
         except Exception as e:
             logger.error(f"Error parsing transaction: {e}", exc_info=True)
             # Return a low-confidence result rather than crashing
-            return ParsedTransaction(
-                action=TransactionAction.OUTGOING,
-                amount=None,
-                source=None,
-                destination=None,
-                description=None,
-                raw_text=text,
-                confidence=0.0,
-            )
+            return self._failed_parse(text)
 
     def _detect_action(self, text_lower: str, doc) -> TransactionAction:
         """Detect the transaction action type from text."""
@@ -367,28 +382,63 @@ class TransactionNLPService:
         if not isinstance(texts, list):
             raise ValueError(f"texts must be a list, got {type(texts)}")
 
-        results = []
+        results: list[Optional[ParsedTransaction]] = [None] * len(texts)
+        valid: list[tuple[int, str]] = []
         for i, text in enumerate(texts):
             try:
-                results.append(self.parse(text))
-            except Exception as e:
+                valid.append((i, self._validate_text(text)))
+            except ValueError as e:
                 logger.warning(f"Error parsing text {i}: {e}")
                 # Add a failed parse result
-                results.append(
-                    ParsedTransaction(
-                        action=TransactionAction.OUTGOING,
-                        amount=None,
-                        source=None,
-                        destination=None,
-                        description=None,
-                        raw_text=text if isinstance(text, str) else "",
-                        confidence=0.0,
-                    )
-                )
+                results[i] = self._failed_parse(text if isinstance(text, str) else "")
+
+        # Run the valid texts through spaCy's pipeline in one pass
+        valid_texts = [text for _, text in valid]
+        try:
+            docs = list(self.nlp.pipe(valid_texts))
+        except Exception as e:
+            logger.error(f"Error processing batch with spaCy: {e}", exc_info=True)
+            docs = [None] * len(valid_texts)
+
+        for (i, text), doc in zip(valid, docs):
+            if doc is None:
+                results[i] = self._failed_parse(text)
+            else:
+                results[i] = self._parse_doc(text, doc)
 
         return results
 
 
+# Per-process service used by parse worker processes
+_worker_service: Optional[TransactionNLPService] = None
+
+
+def init_parse_worker(model_name: str = "en_core_web_sm") -> None:
+    """
+    Load the NLP service once in a worker process.
+
+    Intended as the ``initializer`` of a ProcessPoolExecutor so the spaCy
+    model is loaded per worker rather than pickled with every task.
+
+    Args:
+        model_name: Name of the spaCy model to load
+    """
+    global _worker_service
+    _worker_service = TransactionNLPService(model_name)
+
+
+def parse_batch_in_worker(texts: list[str]) -> list[ParsedTransaction]:
+    """
+    Parse a batch of texts with the worker process's NLP service.
+
+    Raises:
+        RuntimeError: If init_parse_worker has not run in this process
+    """
+    if _worker_service is None:
+        raise RuntimeError("Parse worker has not been initialized")
+    return _worker_service.parse_batch(texts)
+
+
 # Singleton instance for convenience
 _default_service: Optional[TransactionNLPService] = None
 
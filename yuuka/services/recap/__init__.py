@@ -3,6 +3,7 @@ from .service import (
     ForecastResult,
     RecapReport,
     RecapService,
+    render_burndown_chart,
 )
 
 __all__ = [
@@ -10,4 +11,5 @@ __all__ = [
     "ForecastResult",
     "RecapReport",
     "RecapService",
+    "render_burndown_chart",
 ]
@@ -7,27 +7,60 @@ Provides functionality for:
 - Financial health forecasting (will I go red before payday?)
 """
 
+import functools
 import io
 import logging
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Optional
 
-import matplotlib
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
-from matplotlib.ticker import FuncFormatter
-
+from yuuka.config import CHART_DPI, CHART_PALETTE_COLORS
 from yuuka.db.budget import BudgetConfig, BudgetRepository
 from yuuka.db.repository import LedgerRepository
 
-# Use non-interactive backend for Discord bot
-matplotlib.use("Agg")
-
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _setup_plotting():
+    """
+    Import and configure the plotting libraries on first use.
+
+    matplotlib, seaborn and pandas are slow to import and are only needed
+    in the processes that draw charts, so the bot doesn't load them at
+    startup.
+    """
+    import matplotlib
+    import seaborn as sns
+
+    # Use non-interactive backend for Discord bot
+    matplotlib.use("Agg")
+
+    try:
+        sns.set_theme(style="darkgrid")
+    except Exception as e:
+        logger.warning(f"Failed to set seaborn theme: {e}")
+
+
+def _save_chart(fig, buf: io.BytesIO):
+    """
+    Save a figure into buf as a palette PNG and rewind it.
+
+    The charts use a handful of flat colors, so quantizing keeps them
+    looking the same while making the upload several times smaller.
+    """
+    from PIL import Image
+
+    raw = io.BytesIO()
+    fig.savefig(raw, format="png", dpi=CHART_DPI, bbox_inches="tight")
+    raw.seek(0)
+    with Image.open(raw) as image:
+        image.quantize(colors=CHART_PALETTE_COLORS).save(
+            buf, format="PNG", optimize=True
+        )
+    buf.seek(0)
+
+
 @dataclass
 class DailySummary:
     """Summary of a single day's transactions."""
@@ -91,13 +124,7 @@ class RecapService:
         """
         self.ledger_repo = ledger_repo
         self.budget_repo = budget_repo
-
-        # Set up seaborn style
-        try:
-            sns.set_theme(style="darkgrid")
-            logger.info("RecapService initialized successfully")
-        except Exception as e:
-            logger.warning(f"Failed to set seaborn theme: {e}")
+        logger.info("RecapService initialized successfully")
 
     def get_period_start(self, budget: BudgetConfig, for_date: date) -> date:
         """Calculate the start of the current pay period."""
@@ -224,6 +251,7 @@ class RecapService:
         self,
         user_id: str,
         for_date: Optional[date] = None,
+        budget: Optional[BudgetConfig] = None,
     ) -> RecapReport:
         """
         Generate a complete recap report for a user.
@@ -231,6 +259,8 @@ class RecapService:
         Args:
             user_id: Discord user ID
             for_date: Date to generate recap for (defaults to today)
+            budget: The user's budget config if already loaded; looked up
+                when omitted
 
         Returns:
             Complete RecapReport
@@ -239,7 +269,8 @@ class RecapService:
             for_date = date.today()
 
         # Get budget config (or use defaults)
-        budget = self.budget_repo.get_by_user(user_id)
+        if budget is None:
+            budget = self.budget_repo.get_by_user(user_id)
 
         # Get current balance
         current_balance = self.ledger_repo.get_total_balance(user_id)
@@ -300,35 +331,67 @@ class RecapService:
             asset_balances=asset_balances,
         )
 
-    def generate_burndown_chart(
+    def generate_recaps_bulk(
         self,
-        recap: RecapReport,
-        budget: Optional[BudgetConfig] = None,
-    ) -> io.BytesIO:
+        budgets: dict[str, BudgetConfig],
+        for_date: Optional[date] = None,
+    ) -> dict[str, RecapReport]:
         """
-        Generate a burndown chart showing balance over time with forecast.
+        Generate recaps for many users over a single database connection.
+
+        Used by the daily broadcast, which already has every user's budget.
+        A user whose recap fails is logged and left out of the result.
 
         Args:
-            recap: The recap report data
-            budget: Optional budget config for forecast line
+            budgets: Dict mapping user ID to that user's BudgetConfig
+            for_date: Date to generate recaps for (defaults to today)
 
         Returns:
-            BytesIO buffer containing the PNG image
+            Dict mapping user ID to RecapReport
+        """
+        if for_date is None:
+            for_date = date.today()
 
-        Raises:
-            ValueError: If recap data is invalid
+        recaps = {}
+        with self.ledger_repo.session():
+            for user_id, budget in budgets.items():
+                try:
+                    recaps[user_id] = self.generate_recap(user_id, for_date, budget)
+                except Exception as e:
+                    logger.error(
+                        f"Error generating recap for user {user_id}: {e}",
+                        exc_info=True,
+                    )
+        return recaps
+
+    @staticmethod
+    def _draw_burndown_chart(
+        recap: RecapReport,
+        budget: Optional[BudgetConfig],
+        buf: io.BytesIO,
+    ) -> io.BytesIO:
         """
-        if not recap:
-            raise ValueError("recap cannot be None")
+        Draw the burndown chart into buf; see render_burndown_chart.
+
+        Figures are created directly rather than through pyplot, so no
+        figure manager or global state is involved and nothing needs
+        closing afterwards.
+        """
+        _setup_plotting()
+
+        import pandas as pd
+        import seaborn as sns
+        from matplotlib.figure import Figure
+        from matplotlib.ticker import FuncFormatter
 
-        fig = None
         try:
             # Prepare data
             dates = [s.date for s in recap.daily_summaries]
 
             if not dates:
                 # No data - create empty chart
-                fig, ax = plt.subplots(figsize=(10, 6))
+                fig = Figure(figsize=(10, 6))
+                ax = fig.subplots()
                 ax.text(
                     0.5,
                     0.5,
@@ -339,10 +402,7 @@ class RecapService:
                 )
                 ax.set_xlim(0, 1)
                 ax.set_ylim(0, 1)
-                buf = io.BytesIO()
-                fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-                buf.seek(0)
-                plt.close(fig)
+                _save_chart(fig, buf)
                 logger.debug("Generated empty burndown chart")
                 return buf
 
@@ -376,16 +436,16 @@ class RecapService:
 
             if has_categories or has_assets:
                 # 3 subplots: balance, income/spending, and pie chart
-                fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+                fig = Figure(figsize=(14, 10))
+                axes = fig.subplots(2, 2)
                 ax1 = axes[0, 0]  # Balance burndown (top left)
                 ax2 = axes[1, 0]  # Daily income vs spending (bottom left)
                 ax3 = axes[0, 1]  # Spending by category pie (top right)
                 ax4 = axes[1, 1]  # Asset balances bar (bottom right)
             else:
                 # 2 subplots: balance and income/spending
-                fig, (ax1, ax2) = plt.subplots(
-                    2, 1, figsize=(12, 8), height_ratios=[2, 1]
-                )
+                fig = Figure(figsize=(12, 8))
+                ax1, ax2 = fig.subplots(2, 1, height_ratios=[2, 1])
                 ax3 = None
                 ax4 = None
 
@@ -615,22 +675,16 @@ class RecapService:
                 ax4.axis("off")
 
             # Adjust layout
-            plt.tight_layout()
+            fig.tight_layout()
 
             # Save to buffer
-            buf = io.BytesIO()
-            fig.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-            buf.seek(0)
+            _save_chart(fig, buf)
 
             logger.debug(f"Generated burndown chart for user {recap.user_id}")
             return buf
         except Exception as e:
             logger.error(f"Error generating burndown chart: {e}", exc_info=True)
             raise
-        finally:
-            # Always close the figure to free memory
-            if fig is not None:
-                plt.close(fig)
 
     def format_recap_message(self, recap: RecapReport) -> str:
         """
@@ -766,3 +820,28 @@ class RecapService:
         except Exception as e:
             logger.error(f"Error formatting recap message: {e}", exc_info=True)
             raise
+
+
+def render_burndown_chart(
+    recap: RecapReport, budget: Optional[BudgetConfig] = None
+) -> bytes:
+    """
+    Render the burndown chart to PNG bytes.
+
+    This is the only entry point for drawing charts. It's a module-level
+    function so it can be sent to a process pool; each worker process
+    draws one chart at a time, so matplotlib is never used concurrently.
+
+    Args:
+        recap: The recap report data
+        budget: Optional budget config for forecast line
+
+    Returns:
+        The PNG image bytes
+    """
+    if not recap:
+        raise ValueError("recap cannot be None")
+
+    buf = io.BytesIO()
+    RecapService._draw_burndown_chart(recap, budget, buf)
+    return buf.getvalue()